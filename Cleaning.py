@@ -1,12 +1,18 @@
 from __future__ import annotations
 import argparse
+import functools
+import hashlib
+import inspect
 import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
-import kagglehub
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
 import pandas as pd
 import re 
-from src.data.database import persist_sqlite
+from src.data.plant_index import persist_sqlite
 
 pd.options.mode.copy_on_write = True
 
@@ -80,16 +86,53 @@ KEY_PRIORITY: Sequence[Tuple[str, ...]] = (
 )
 
 
-def download_datasets(config: Dict[str, Dict[str, object]]) -> Dict[str, Path]:
-    paths: Dict[str, Path] = {}
-    for name, info in config.items():
-        ref = info["ref"]
-        path = Path(kagglehub.dataset_download(ref))  # type: ignore[arg-type]
-        paths[name] = path
-        logger.info("Downloaded %s dataset to %s", name, path)
+def _download_one(name: str, info: Dict[str, object]) -> Path:
+    import kagglehub  # only needed for live downloads, not --local-dir runs
+    path = Path(kagglehub.dataset_download(info["ref"]))  # type: ignore[arg-type]
+    logger.info("Downloaded %s dataset to %s", name, path)
+    return path
+
+
+def download_datasets(config: Dict[str, Dict[str, object]], jobs: int = 1) -> Dict[str, Path]:
+    # Downloads are I/O bound, so threads are enough; results keep config order.
+    if jobs <= 1:
+        return {name: _download_one(name, info) for name, info in config.items()}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {name: pool.submit(_download_one, name, info) for name, info in config.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def local_datasets(config: Dict[str, Dict[str, object]], root: Path) -> Dict[str, Path]:
+    # Offline stand-in for download_datasets: <root>/<dataset name>/ holds each CSV
+    paths = {name: root / name for name in config}
+    missing = [name for name, path in paths.items() if not path.is_dir()]
+    if missing:
+        raise FileNotFoundError(f"No dataset directories under {root} for: {', '.join(missing)}")
     return paths
 
 
+def clean_datasets(
+    paths: Dict[str, Path],
+    config: Dict[str, Dict[str, object]],
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    chunksize: int | None = None,
+) -> Dict[str, pd.DataFrame]:
+    # Cleaning is CPU bound pandas work, so it goes to processes. The returned
+    # dict follows `paths` order, which is what merge_dataframes folds over.
+    if jobs <= 1:
+        return {
+            name: load_clean_dataset(name, base, config[name], cache_dir, chunksize)
+            for name, base in paths.items()
+        }
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            name: pool.submit(load_clean_dataset, name, base, config[name], cache_dir, chunksize)
+            for name, base in paths.items()
+        }
+        return {name: fut.result() for name, fut in futures.items()}
+
+
 def build_plant_index(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     candidates = [
@@ -104,16 +147,26 @@ def build_plant_index(df: pd.DataFrame) -> pd.DataFrame:
     return idx
 
 
-def pick_name(row, candidates: list) -> str:
+def pick_names(df: pd.DataFrame, candidates: list) -> pd.Series:
+    # First non-blank candidate per row, resolved column by column:
+    # each column only fills the rows still unresolved by earlier ones.
+    names = np.full(len(df), "", dtype=object)
+    todo = np.ones(len(df), dtype=bool)
     for c in candidates:
-        v = row.get(c)
-        if pd.notna(v) and str(v).strip():
-            return str(v).strip()
-    return ""
+        if c not in df.columns or not todo.any():
+            continue
+        col = df[c].iloc[np.flatnonzero(todo)]
+        present = col.notna().to_numpy()
+        text = col.astype(object).where(present, "").astype(str).str.strip().to_numpy(dtype=object)
+        found = present & (text != "")
+        rows = np.flatnonzero(todo)[found]
+        names[rows] = text[found]
+        todo[rows] = False
+    return pd.Series(names, index=df.index, dtype=object)
 
 def create_index_df(df: pd.DataFrame, candidates: list) -> pd.DataFrame:
     idx = pd.DataFrame({
-        "name": df.apply(lambda row: pick_name(row, candidates), axis=1),
+        "name": pick_names(df, candidates),
         "water_frequency": df.get("water_frequency", pd.Series([pd.NA] * len(df))),
         "sunlight_hours": df.get("sunlight_hours", pd.Series([pd.NA] * len(df))),
         "soil_type": df.get("soil_type", pd.Series([pd.NA] * len(df))),
@@ -147,54 +200,301 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
         .str.replace("-", "_", regex=False)
     )
     for col in df.select_dtypes(include="object"):
-        df[col] = df[col].astype(str).str.strip()
+        # keep real nulls; a bare astype(str) turns NaN into the text "nan"
+        df[col] = df[col].astype(str).str.strip().where(df[col].notna())
     df = df.drop_duplicates().reset_index(drop=True)
     return df
 
+
+def _is_text(series: pd.Series) -> bool:
+    if not (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+        return False
+    return pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
+
+
+def _text_dtype() -> str | None:
+    try:
+        import pyarrow  # noqa: F401
+        return "string[pyarrow]"
+    except ImportError:
+        return None
+
+
+def _compact(df: pd.DataFrame, category_ratio: float) -> pd.DataFrame:
+    df = df.copy()
+    text_dtype = _text_dtype()
+    for col in df.columns:
+        s = df[col]
+        if _is_text(s):
+            non_null = s.count()
+            if non_null and s.nunique(dropna=True) <= category_ratio * non_null:
+                df[col] = s.astype("category")
+            elif text_dtype:
+                df[col] = s.astype(text_dtype)
+        elif pd.api.types.is_integer_dtype(s) and not pd.api.types.is_extension_array_dtype(s):
+            df[col] = pd.to_numeric(s, downcast="integer")
+        elif pd.api.types.is_float_dtype(s) and s.dtype == np.float64:
+            small = s.astype(np.float32)
+            if ((small.astype(np.float64) == s) | s.isna()).all():
+                df[col] = small
+    return df
+
+
+def compact_dtypes(df: pd.DataFrame, name: str = "", category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Shrink a cleaned frame: low-cardinality text -> category, other text ->
+    Arrow strings (when pyarrow is available), integers -> smallest int type,
+    floats -> float32 only where that is lossless. Nulls stay nulls; object
+    columns mixing numbers and text are left alone.
+    """
+    before = df.memory_usage(deep=True).sum()
+    df = _compact(df, category_ratio)
+    after = df.memory_usage(deep=True).sum()
+    logger.info("Compacted %s: %.1f MiB -> %.1f MiB", name or "frame", before / 2**20, after / 2**20)
+    return df
+
+
+def concat_compacted(chunks: Iterable[pd.DataFrame], name: str = "", category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    compact_dtypes(pd.concat(chunks)) without ever holding the chunks
+    uncompacted. Each chunk is compacted as it arrives with all of its text
+    kept as category; the text columns are then unioned and given the dtype
+    compact_dtypes would pick for the whole frame.
+    """
+    before = after = 0
+    parts = []
+    for chunk in chunks:
+        before += chunk.memory_usage(deep=True).sum()
+        parts.append(_compact(chunk, category_ratio=1.0))
+        del chunk
+    if not parts:
+        return pd.DataFrame()
+    text_dtype = _text_dtype()
+    columns = {}
+    for col in parts[0].columns:
+        pieces = [part[col] for part in parts]
+        cats = [s for s in pieces if isinstance(s.dtype, pd.CategoricalDtype)]
+        # All-null text chunks are not categorical; anything else means mixed values
+        if cats and all(isinstance(s.dtype, pd.CategoricalDtype) or s.isna().all() for s in pieces):
+            categories = cats[0].cat.categories.dtype
+            pieces = [s if isinstance(s.dtype, pd.CategoricalDtype)
+                      else s.astype(pd.CategoricalDtype(pd.Index([], dtype=categories))) for s in pieces]
+            combined = pd.Series(pd.api.types.union_categoricals(pieces, sort_categories=True), name=col)
+            non_null = combined.count()
+            if not (non_null and len(combined.cat.categories) <= category_ratio * non_null) and text_dtype:
+                combined = combined.astype(text_dtype)
+        else:
+            combined = pd.concat(pieces, ignore_index=True)
+        columns[col] = combined
+    del parts
+    df = pd.DataFrame(columns)
+    after = df.memory_usage(deep=True).sum()
+    logger.info("Compacted %s: %.1f MiB -> %.1f MiB", name or "frame", before / 2**20, after / 2**20)
+    return df
+
 import re
 
 RANGE_RE = re.compile(r"^(-?\d+(?:\.\d+)?)\s*[-–]\s*(-?\d+(?:\.\d+)?)$")
 
-def _coerce_numeric(series: pd.Series) -> pd.Series:
-    def parse(value):
-        if pd.isna(value):
-            return pd.NA
-        text = str(value).strip()
-        if text == "":
-            return pd.NA
-        match = RANGE_RE.match(text)
-        if match:
-            lo, hi = map(float, match.groups())
-            return (lo + hi) / 2
-        if re.fullmatch(r"-?\d+(?:\.\d+)?", text):
-            return float(text)
-        return text  # leave non-numeric as-is
-    return series.map(parse)
+NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
 
-def convert_types(df: pd.DataFrame) -> pd.DataFrame:
+def _coerce_numeric(series: pd.Series) -> pd.Series:
+    # Vectorized: "a-b" ranges -> midpoint, plain numbers -> float,
+    # blanks/NA -> pd.NA, anything else stays as stripped text.
+    # The regex work runs once per distinct value, then fans out via codes.
+    if series.empty:
+        return series.copy()
+    missing = series.isna().to_numpy()
+    codes, uniques = pd.factorize(series.astype(object).where(~missing, "").astype(str))
+    text = pd.Series(uniques, dtype=object).str.strip()
+    bounds = text.str.extract(RANGE_RE)
+    is_range = bounds[0].notna().to_numpy()
+    is_number = text.str.fullmatch(NUMBER_RE).to_numpy(dtype=bool) & ~is_range
+    parsed = text.to_numpy(dtype=object, copy=True)
+    parsed[is_number] = text[is_number].astype(float).to_numpy()
+    if is_range.any():
+        lo = bounds.loc[is_range, 0].astype(float).to_numpy()
+        hi = bounds.loc[is_range, 1].astype(float).to_numpy()
+        parsed[is_range] = (lo + hi) / 2
+    parsed[text.eq("").to_numpy()] = pd.NA
+    out = parsed[codes]
+    out[missing] = pd.NA
+    # Same dtype inference Series.map applied to the per-cell results
+    return pd.Series(out, index=series.index, name=series.name).infer_objects()
+
+def coerce_types(df: pd.DataFrame) -> pd.DataFrame:
+    # Row-local part of convert_types; safe to run chunk by chunk.
     df = df.copy()
-    
-
     for col in df.columns:
-        if df[col].dtype == object:
+        # pandas >= 3 reads text columns as the "str" dtype, not object
+        if df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype):
             df[col] = _coerce_numeric(df[col])
     numeric_cols = df.select_dtypes(include="number").columns
     df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
-    df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
     return df
 
+def _infer_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    # read_csv's number inference, for chunks read as text (booleans stay text)
+    df = df.copy()
+    for col in df.columns:
+        try:
+            numbers = df[col].astype("float64")
+        except (ValueError, TypeError):
+            continue
+        if not numbers.isna().any():
+            try:
+                numbers = df[col].astype("int64")  # integer literals only, as read_csv
+            except (ValueError, TypeError, OverflowError):
+                pass
+        df[col] = numbers
+    return df
+
+def convert_types(df: pd.DataFrame) -> pd.DataFrame:
+    df = coerce_types(df)
+    numeric_cols = df.select_dtypes(include="number").columns
+    df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
+    return df
 
 
-def load_clean_dataset(name: str, base_path: Path, info: Dict[str, object]) -> pd.DataFrame:
+def iter_clean_chunks(csv_path: Path, name: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Bounded-memory standardize_columns + convert_types for one CSV.
+
+    Pass 1 reads `chunksize` rows at a time as text, drops rows already seen
+    in earlier chunks (by hash of the stripped text), cleans the rest and
+    spills each chunk to a temp dir, with its numeric columns also saved
+    separately. Medians are then taken one column at a time, and pass 2 fills
+    the spilled chunks and yields them.
+    The generator itself holds one chunk, a sorted array of 8 bytes per
+    distinct row and, while taking medians, one numeric column of the whole
+    file as float64. Whatever the caller keeps of the yielded chunks comes on
+    top; load_clean_dataset compacts each one as it arrives.
+    """
+    with tempfile.TemporaryDirectory(prefix=f"clean-{name}-") as tmp_dir:
+        tmp = Path(tmp_dir)
+        seen = np.empty(0, dtype=np.uint64)
+        numeric: set[str] | None = None
+        parts = 0
+        # Read as text so rows are compared as the stripped text the whole-file
+        # drop_duplicates sees, not as values whose dtype depends on the chunk
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=str):
+            chunk = standardize_columns(chunk)
+            hashes = pd.util.hash_pandas_object(chunk, index=False, categorize=False).to_numpy()
+            # `seen` stays sorted: look up by binary search, merge new hashes in
+            pos = np.searchsorted(seen, hashes)
+            fresh = seen[np.minimum(pos, len(seen) - 1)] != hashes if len(seen) else np.ones(len(hashes), bool)
+            chunk = chunk[fresh].reset_index(drop=True)
+            new = np.unique(hashes[fresh])
+            seen = np.insert(seen, np.searchsorted(seen, new), new)
+            if chunk.empty:
+                continue
+            chunk = coerce_types(_infer_numeric(chunk))
+            # Only columns numeric in every chunk get a median, as in convert_types
+            chunk_numeric = set(chunk.select_dtypes(include="number").columns)
+            numeric = chunk_numeric if numeric is None else numeric & chunk_numeric
+            for col in chunk_numeric:
+                np.save(tmp / f"{parts}-{list(chunk.columns).index(col)}.npy", chunk[col].to_numpy(dtype=float))
+            chunk.to_pickle(tmp / f"{parts}.pkl")
+            parts += 1
+        del seen
+
+        if parts == 0:
+            return
+        columns = list(pd.read_pickle(tmp / "0.pkl").columns)
+        medians = {}
+        for col in sorted(numeric or (), key=columns.index):
+            pos = columns.index(col)
+            values = np.concatenate([np.load(tmp / f"{i}-{pos}.npy") for i in range(parts)])
+            medians[col] = np.nanmedian(values) if not np.isnan(values).all() else np.nan
+            del values
+
+        for i in range(parts):
+            chunk = pd.read_pickle(tmp / f"{i}.pkl")
+            if medians:
+                chunk = chunk.fillna(medians)
+            # A column numeric here but mixed elsewhere holds floats and pd.NA
+            # in an object column, as coerce_types leaves it for the whole file
+            for col in chunk.select_dtypes(include="number").columns.difference(list(numeric or ())):
+                chunk[col] = chunk[col].astype(float).astype(object).where(chunk[col].notna(), pd.NA)
+            yield chunk
+
+
+
+@functools.lru_cache(maxsize=None)
+def cleaning_code_version() -> str:
+    # Hash of the cleaning code itself, so editing any step invalidates the cache
+    # without anyone having to remember to bump a version number. Whether
+    # pyarrow is installed changes the text dtype, so that is hashed too.
+    # choose_csv is covered by the digest of the file it picked; pick_names
+    # runs on the merged frame, after the cache.
+    h = hashlib.sha256(pd.__version__.encode())
+    h.update(str(_text_dtype()).encode())
+    for fn in (
+        load_clean_dataset, iter_clean_chunks, standardize_columns, _is_text, _text_dtype,
+        _infer_numeric, coerce_types, convert_types, _coerce_numeric,
+        _compact, compact_dtypes, concat_compacted,
+    ):
+        h.update(inspect.getsource(fn).encode())
+    h.update(RANGE_RE.pattern.encode())
+    h.update(NUMBER_RE.pattern.encode())
+    return h.hexdigest()
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cached_frame_path(cache_dir: Path, name: str, csv_path: Path, chunked: bool = False) -> Path:
+    # Chunked and whole-file loads are cached apart until they are proven identical
+    mode = "chunked" if chunked else "whole"
+    key = hashlib.sha256(f"{file_digest(csv_path)}:{cleaning_code_version()}:{mode}".encode()).hexdigest()
+    return cache_dir / f"{name}-{key[:24]}.parquet"
+
+
+def load_clean_dataset(
+    name: str,
+    base_path: Path,
+    info: Dict[str, object],
+    cache_dir: Path | None = None,
+    chunksize: int | None = None,
+) -> pd.DataFrame:
     csv_path = choose_csv(base_path, info.get("preferred_files", []))
+    cached = _cached_frame_path(cache_dir, name, csv_path, bool(chunksize)) if cache_dir else None
+    if cached is not None and cached.exists():
+        logger.info("Loading %s from cache %s", name, cached.name)
+        return pd.read_parquet(cached)
     logger.info("Loading %s from %s", name, csv_path.name)
-    df = pd.read_csv(csv_path)
-    df = standardize_columns(df)
-    df = convert_types(df)
-    df["source_dataset"] = name
+    if chunksize:
+        df = concat_compacted(
+            (chunk.assign(source_dataset=name) for chunk in iter_clean_chunks(csv_path, name, chunksize)), name
+        )
+    else:
+        df = pd.read_csv(csv_path)
+        df = standardize_columns(df)
+        df = convert_types(df)
+        df["source_dataset"] = name
+        df = compact_dtypes(df, name)
+    if cached is not None:
+        _write_cache(df, cached)
     return df
 
 
+def _write_cache(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except (ImportError, OSError, ValueError, TypeError) as exc:
+        # e.g. pyarrow missing, or object columns mixing numbers and text
+        logger.warning("Not caching %s: %s", path.name, exc)
+        tmp.unlink(missing_ok=True)
+
+
 def find_merge_keys(left_cols: Iterable[str], right_cols: Iterable[str]) -> Tuple[str, ...] | None:
     left_set = set(left_cols)
     right_set = set(right_cols)
@@ -204,22 +504,124 @@ def find_merge_keys(left_cols: Iterable[str], right_cols: Iterable[str]) -> Tupl
     return None
 
 
-def merge_dataframes(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-    items = list(frames.items())
-    if not items:
-        raise ValueError("No datasets were loaded.")
-    unified_name, unified_df = items[0]
-    logger.info("Using %s as the base table", unified_name)
-    for name, df in items[1:]:
-        keys = find_merge_keys(unified_df.columns, df.columns)
+def plan_merges(
+    frames: Dict[str, pd.DataFrame],
+    names: Sequence[str] | None = None,
+    joined_cols: Iterable[str] | None = None,
+) -> Tuple[List[Tuple[str, Tuple[str, ...]]], List[str]]:
+    """
+    Decide, from column names only, which datasets join the base table and on
+    which keys (same KEY_PRIORITY rules as before, checked against the columns
+    accumulated by earlier joins) and which are only concatenated at the end.
+    `names`/`joined_cols` re-plan the datasets still to come from the columns
+    actually joined so far.
+    """
+    if names is None:
+        names = list(frames)[1:]
+    if joined_cols is None:
+        joined_cols = frames[next(iter(frames))].columns
+    joined = set(joined_cols)
+    joins: List[Tuple[str, Tuple[str, ...]]] = []
+    loose: List[str] = []
+    for name in names:
+        keys = find_merge_keys(joined, frames[name].columns)
         if keys:
-            logger.info("Merging %s on keys %s", name, keys)
-            unified_df = unified_df.merge(df, on=list(keys), how="outer", suffixes=("", f"_{name}"))
+            joins.append((name, keys))
+            joined.update(frames[name].columns)
         else:
-            logger.warning("No common keys found with %s; concatenating rows instead", name)
-            unified_df = pd.concat([unified_df, df], ignore_index=True, sort=False)
-    unified_df = unified_df.sort_index().reset_index(drop=True)
-    return unified_df
+            loose.append(name)
+    return joins, loose
+
+
+def key_cardinality(left: pd.DataFrame, right: pd.DataFrame, keys: Sequence[str]) -> Dict[str, int]:
+    # Exact outer-join size from per-key row counts, without performing the join.
+    lc = left.groupby(list(keys), dropna=False, observed=True).size().rename("l")
+    rc = right.groupby(list(keys), dropna=False, observed=True).size().rename("r")
+    both = pd.concat([lc, rc], axis=1, join="inner")
+    matched = int((both["l"] * both["r"]).sum())
+    return {
+        "left_rows": len(left),
+        "right_rows": len(right),
+        "left_dup_keys": int((lc > 1).sum()),
+        "right_dup_keys": int((rc > 1).sum()),
+        "output_rows": matched + (len(left) - int(both["l"].sum())) + (len(right) - int(both["r"].sum())),
+    }
+
+
+def _has_unique_keys(df: pd.DataFrame, keys: Sequence[str]) -> bool:
+    cols = df[list(keys)]
+    return not cols.isna().any().any() and not cols.duplicated().any()
+
+
+def _indexed_join(left: pd.DataFrame, rights: List[Tuple[str, pd.DataFrame]], keys: Sequence[str]) -> pd.DataFrame:
+    """Outer-join several frames that all have unique keys in one pass over key-indexed frames."""
+    keys = list(keys)
+    columns = list(left.columns)
+    parts = [left.set_index(keys)]
+    for name, df in rights:
+        clash = {c: f"{c}_{name}" for c in df.columns if c in columns and c not in keys}
+        df = df.rename(columns=clash)
+        columns += [c for c in df.columns if c not in keys]
+        parts.append(df.set_index(keys))
+    # sort=True gives the same key order an outer merge produces
+    joined = pd.concat(parts, axis=1, join="outer", sort=True).reset_index()
+    return joined[columns]
+
+
+def merge_dataframes(frames: Dict[str, pd.DataFrame], max_expansion: float = 10.0) -> pd.DataFrame:
+    """
+    Join datasets that share keys with the base table, then append the rest
+    in a single concat. Consecutive joins on the same keys whose sides all
+    have unique keys run as one indexed join; others fall back to merge. A
+    join whose exact output size exceeds `max_expansion` x its inputs (a
+    many-to-many explosion) is skipped and the dataset is appended instead.
+    """
+    if not frames:
+        raise ValueError("No datasets were loaded.")
+    base_name = next(iter(frames))
+    logger.info("Using %s as the base table", base_name)
+    joins, loose = plan_merges(frames)
+    for name in loose:
+        logger.warning("No common keys found with %s; concatenating rows instead", name)
+
+    unified_df = frames[base_name]
+    i = 0
+    while i < len(joins):
+        keys = joins[i][1]
+        group = []
+        while i < len(joins) and joins[i][1] == keys:
+            group.append(joins[i][0])
+            i += 1
+
+        # Unique keys on both sides cannot fan out, so the exact count is only
+        # needed when a side repeats keys.
+        if _has_unique_keys(unified_df, keys) and all(_has_unique_keys(frames[n], keys) for n in group):
+            logger.info("Merging %s on keys %s (indexed, one-to-one)", group, keys)
+            unified_df = _indexed_join(unified_df, [(n, frames[n]) for n in group], keys)
+            continue
+
+        rejected = False
+        for name in group:
+            stats = key_cardinality(unified_df, frames[name], keys)
+            logger.info("Join %s on %s: %s", name, keys, stats)
+            if stats["output_rows"] > max_expansion * max(stats["left_rows"] + stats["right_rows"], 1):
+                logger.warning("Join with %s would explode to %d rows; concatenating instead", name, stats["output_rows"])
+                loose.append(name)
+                rejected = True
+                continue
+            logger.info("Merging %s on keys %s", name, keys)
+            unified_df = unified_df.merge(frames[name], on=list(keys), how="outer", suffixes=("", f"_{name}"))
+
+        if rejected:
+            # Later keys may have relied on columns the skipped dataset would
+            # have brought; re-plan the rest against what was really joined.
+            later, more_loose = plan_merges(frames, [n for n, _ in joins[i:]], unified_df.columns)
+            joins[i:] = later
+            loose += more_loose
+
+    if loose:
+        unified_df = pd.concat([unified_df] + [frames[n] for n in loose], ignore_index=True, sort=False)
+    return unified_df.reset_index(drop=True)
 
 
 def summarize(df: pd.DataFrame) -> None:
@@ -250,16 +652,46 @@ def parse_args():
                         help="Destination file (.csv or .parquet).")
     parser.add_argument("--sqlite", 
                         type=Path, 
-                        default=Path("src/data/Plants.db"),
+                        default=Path("src/data/Plant.db"),
                         help="SQLite DB path for plant index.")
+    parser.add_argument("--local-dir",
+                        type=Path,
+                        default=None,
+                        help="Read <dir>/<dataset>/*.csv instead of downloading from Kaggle.")
+    parser.add_argument("--jobs",
+                        type=int,
+                        default=1,
+                        help="Download/clean this many datasets concurrently (1 = sequential).")
+    parser.add_argument("--cache-dir",
+                        type=Path,
+                        default=Path("data/.cache/cleaned"),
+                        help="Cache of cleaned per-dataset frames, keyed by CSV content hash.")
+    parser.add_argument("--no-cache",
+                        action="store_true",
+                        help="Always re-clean every dataset.")
+    parser.add_argument("--chunksize",
+                        type=int,
+                        default=None,
+                        help="Stream each CSV in chunks of this many rows (bounded memory).")
+    parser.add_argument("--sqlite-mode",
+                        choices=["upsert", "bulk", "delta"],
+                        default="upsert",
+                        help="upsert merges into Plant.db; bulk replaces the table and rebuilds its indexes once; "
+                             "delta writes only inserted/changed rows and deletes names no longer in the index.")
     return parser.parse_args()
 
 def main() -> None:
     args = parse_args()
     
     only = {"companion_plants": DATASETS["companion_plants"]}
-    download_paths = download_datasets(DATASETS)
-    frames = {name: load_clean_dataset(name, base_path, DATASETS[name]) for name, base_path in download_paths.items()}
+    if args.local_dir:
+        download_paths = local_datasets(DATASETS, args.local_dir)
+    else:
+        download_paths = download_datasets(DATASETS, jobs=args.jobs)
+    cache_dir = None if args.no_cache else args.cache_dir
+    frames = clean_datasets(
+        download_paths, DATASETS, jobs=args.jobs, cache_dir=cache_dir, chunksize=args.chunksize
+    )
     
     unified = merge_dataframes(frames)
     summarize(unified)
@@ -267,7 +699,7 @@ def main() -> None:
     persist(unified, args.output)
     
     plant_index = build_plant_index(unified)
-    persist_sqlite(plant_index, Path("src/data/Plant.db"))
+    persist_sqlite(plant_index, args.sqlite, mode=args.sqlite_mode)
 
 
 
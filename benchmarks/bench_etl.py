@@ -0,0 +1,130 @@
+"""
+Per-stage timings of the Cleaning.py pipeline on synthetic datasets.
+
+    python benchmarks/bench_etl.py --rows 10000 1000000
+    python benchmarks/bench_etl.py --data-dir data/synthetic --end-to-end
+
+Generates Kaggle-shaped CSVs (synthetic_datasets.py) for each size, or
+reuses --data-dir, then runs the pipeline stage by stage the way
+load_clean_dataset and main do, printing one JSON object per (size, stage).
+--end-to-end also times `python Cleaning.py --local-dir ... --no-cache`.
+"""
+from __future__ import annotations
+import argparse
+import contextlib
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import Cleaning  # noqa: E402
+from src.data.plant_index import persist_sqlite  # noqa: E402
+from synthetic_datasets import generate  # noqa: E402
+
+
+def _rows(value) -> int | None:
+    if isinstance(value, dict):
+        return sum(len(df) for df in value.values())
+    return len(value) if isinstance(value, pd.DataFrame) else None
+
+
+def _stage(results: list, rows: int, stage: str, rows_in: int | None, fn: Callable):
+    # create_index_df prints a preview; keep stdout for the JSON lines
+    with contextlib.redirect_stdout(sys.stderr):
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+    if rows_in is None:  # sources: count what was produced
+        rows_in = _rows(out)
+    result = {
+        "rows": rows,
+        "stage": stage,
+        "rows_in": rows_in,
+        "rows_out": _rows(out),
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows_in / elapsed) if elapsed else None,
+    }
+    print(json.dumps(result), flush=True)
+    results.append(result)
+    return out
+
+
+def run_stages(data_dir: Path, rows: int, workdir: Path, sqlite_mode: str = "bulk") -> list[dict]:
+    results: list[dict] = []
+    paths = Cleaning.local_datasets(Cleaning.DATASETS, data_dir)
+    raw: Dict[str, pd.DataFrame] = _stage(results, rows, "read_csv", None, lambda: {
+        name: pd.read_csv(Cleaning.choose_csv(path, Cleaning.DATASETS[name]["preferred_files"]))
+        for name, path in paths.items()
+    })
+    total = _rows(raw)
+
+    frames = _stage(results, rows, "standardize_columns", total,
+                    lambda: {name: Cleaning.standardize_columns(df) for name, df in raw.items()})
+    frames = _stage(results, rows, "convert_types", _rows(frames),
+                    lambda: {name: Cleaning.convert_types(df) for name, df in frames.items()})
+    for name, df in frames.items():
+        df["source_dataset"] = name
+    frames = _stage(results, rows, "compact_dtypes", _rows(frames),
+                    lambda: {name: Cleaning.compact_dtypes(df, name) for name, df in frames.items()})
+    unified = _stage(results, rows, "merge_dataframes", _rows(frames), lambda: Cleaning.merge_dataframes(frames))
+    index = _stage(results, rows, "build_plant_index", len(unified), lambda: Cleaning.build_plant_index(unified))
+    _stage(results, rows, "persist", len(unified),
+           lambda: Cleaning.persist(unified, workdir / "unified_plants.parquet"))
+    _stage(results, rows, f"persist_sqlite[{sqlite_mode}]", len(index),
+           lambda: persist_sqlite(index, workdir / "Plant.db", mode=sqlite_mode))
+    return results
+
+
+def run_end_to_end(data_dir: Path, rows: int, workdir: Path, sqlite_mode: str = "bulk") -> dict:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "Cleaning.py", "--local-dir", str(data_dir), "--no-cache",
+         "--output", str(workdir / "e2e" / "unified_plants.parquet"),
+         "--sqlite", str(workdir / "e2e" / "Plant.db"), "--sqlite-mode", sqlite_mode],
+        cwd=PROJECT_ROOT, check=True, stdout=subprocess.DEVNULL,
+    )
+    result = {"rows": rows, "stage": "main", "seconds": round(time.perf_counter() - start, 3)}
+    print(json.dumps(result), flush=True)
+    return result
+
+
+def run(sizes: list[int], data_dir: Path | None = None, sqlite_mode: str = "bulk",
+        end_to_end: bool = False, seed: int = 0) -> list[dict]:
+    results = []
+    for rows in sizes if data_dir is None else [0]:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            source = data_dir
+            if source is None:
+                source = workdir / "datasets"
+                generate(source, rows, seed)
+            results += run_stages(source, rows, workdir, sqlite_mode)
+            if end_to_end:
+                results.append(run_end_to_end(source, rows, workdir, sqlite_mode))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000],
+                        help="Total synthetic rows per run (10k/1M/10M)")
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help="Use existing <dir>/<dataset>/*.csv instead of generating")
+    parser.add_argument("--sqlite-mode", choices=["upsert", "bulk", "delta"], default="bulk")
+    parser.add_argument("--end-to-end", action="store_true", help="Also time a full Cleaning.py run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.rows, args.data_dir, args.sqlite_mode, args.end_to_end, args.seed)
+
+
+if __name__ == "__main__":
+    main()
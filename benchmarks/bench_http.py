@@ -0,0 +1,196 @@
+"""
+Requests/second and p50/p99 latency of the app under gunicorn.
+
+    python benchmarks/bench_http.py --rows 100000 --concurrency 8 --duration 10
+    python benchmarks/bench_http.py --save-baseline benchmarks/baselines/http.json
+
+Builds a synthetic Plant.db and Accounts.db in a temp dir, starts
+create_app under gunicorn on a free local port with the production config
+(src/components/Backend/gunicorn_conf.py), then drives each scenario with
+concurrent clients for a fixed time. Prints one JSON object per scenario;
+--output/--save-baseline write the whole run (settings + results) as one
+JSON document, which test_bench_http.py compares against.
+"""
+from __future__ import annotations
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "bench-password"
+SEARCH_TERMS = ["ros", "rose", "bas", "basil", "fer", "pothos", "plant 1", "plant 42", "zzz"]
+PAGES = ["/", "/login.html", "/signup", "/dashboard", "/add-plant"]
+
+# name -> (method, path factory, form body or None)
+SCENARIOS = {
+    "search": ("GET", lambda rng: "/api/plants/search?" + urlencode({"q": rng.choice(SEARCH_TERMS)}), None),
+    "login": ("POST", lambda rng: "/login", {"email": BENCH_EMAIL, "password": BENCH_PASSWORD}),
+    "health": ("GET", lambda rng: "/health", None),
+    "static": ("GET", lambda rng: rng.choice(PAGES), None),
+}
+
+
+def build_databases(workdir: Path, rows: int, bcrypt_rounds: int) -> dict:
+    """Synthetic Plant.db plus an Accounts.db holding the benchmark user."""
+    from bench_persist_sqlite import synthetic_index
+    from src.data.plant_index import persist_sqlite
+    import src.data.database as database
+    import src.data.Auth as auth
+
+    plant_db = workdir / "Plant.db"
+    persist_sqlite(synthetic_index(rows), plant_db, mode="bulk")
+
+    database.db_path = workdir / "Accounts.db"
+    auth.BCRYPT_ROUNDS = bcrypt_rounds
+    database.init_db()
+    auth.create_user("bench", BENCH_EMAIL, BENCH_PASSWORD)
+    return {"PLANT_DB_PATH": str(plant_db), "ACCOUNTS_DB_PATH": str(database.db_path)}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(env_overrides: dict, workers: int, workdir: Path) -> tuple[subprocess.Popen, int]:
+    port = _free_port()
+    env = dict(os.environ, **env_overrides,
+               PYTHONPATH=str(PROJECT_ROOT),
+               DATA_DIR=str(workdir),
+               PROMETHEUS_MULTIPROC_DIR=str(workdir / "prometheus"))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "python:src.components.Backend.gunicorn_conf",
+         "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--log-level", "warning",
+         "src.components.Backend.wsgi:app"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {proc.returncode}")
+        try:
+            status, _ = _request("127.0.0.1", port, "GET", "/health", None)
+            if status == 200:
+                return proc, port
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("gunicorn did not become ready within 30s")
+
+
+def _request(host: str, port: int, method: str, path: str, form: dict | None) -> tuple[int, int]:
+    con = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        body = urlencode(form) if form is not None else None
+        headers = {"Content-Type": "application/x-www-form-urlencoded"} if form is not None else {}
+        con.request(method, path, body=body, headers=headers)
+        resp = con.getresponse()
+        return resp.status, len(resp.read())
+    finally:
+        con.close()
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def drive(port: int, scenario: str, concurrency: int, duration: float, seed: int = 0) -> dict:
+    """Run one scenario with `concurrency` client threads for `duration` seconds."""
+    method, path_for, form = SCENARIOS[scenario]
+    latencies: list[list[float]] = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    stop_at = time.perf_counter() + duration
+
+    def client(i: int) -> None:
+        rng = random.Random(seed * 1000 + i)
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                status, _ = _request("127.0.0.1", port, method, path_for(rng), form)
+            except OSError:
+                status = 0
+            latencies[i].append(time.perf_counter() - start)
+            if status >= 400 or status == 0:
+                errors[i] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(x for per_client in latencies for x in per_client)
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "errors": sum(errors),
+        "rps": round(len(samples) / elapsed, 1),
+        "p50_ms": round(_percentile(samples, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(samples, 0.99) * 1000, 2),
+    }
+
+
+def run(rows: int = 100_000, workers: int = 2, concurrency: int = 8, duration: float = 10.0,
+        scenarios: list[str] | None = None, bcrypt_rounds: int = 12) -> dict:
+    settings = {
+        "rows": rows, "workers": workers, "concurrency": concurrency, "duration": duration,
+        "scenarios": scenarios or list(SCENARIOS), "bcrypt_rounds": bcrypt_rounds,
+    }
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        env = build_databases(workdir, rows, bcrypt_rounds)
+        env["BCRYPT_ROUNDS"] = str(bcrypt_rounds)
+        proc, port = start_server(env, workers, workdir)
+        try:
+            for scenario in settings["scenarios"]:
+                drive(port, scenario, concurrency, min(1.0, duration))  # warm caches/connections
+                result = drive(port, scenario, concurrency, duration)
+                print(json.dumps(result), flush=True)
+                results.append(result)
+        finally:
+            proc.terminate()
+            proc.wait(10)
+    return {"settings": settings, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Plants in the synthetic Plant.db")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--output", type=Path, help="Write the full run as JSON")
+    parser.add_argument("--save-baseline", type=Path, help="Same as --output; the file test_bench_http.py reads")
+    args = parser.parse_args()
+
+    report = run(args.rows, args.workers, args.concurrency, args.duration, args.scenarios, args.bcrypt_rounds)
+    for path in filter(None, (args.output, args.save_baseline)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Rows/second for persist_sqlite's upsert, bulk and delta paths.
+
+    python benchmarks/bench_persist_sqlite.py --sizes 10000 100000 1000000
+
+Each run writes a synthetic plant index into a temp Plant.db and prints one
+JSON object per (scenario, mode, size). "fresh" starts from an empty file;
+"refresh" rewrites a DB that already holds the index and its plants_fts,
+which is what a scheduled ETL run does.
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.plant_index import persist_sqlite  # noqa: E402
+
+
+def synthetic_index(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    water = rng.integers(1, 30, n).astype(float)
+    water[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({
+        "name": [f"Plant {i} {w}" for i, w in zip(range(n), rng.choice(["rose", "basil", "fern", "pothos"], n))],
+        "water_frequency": water,
+        "sunlight_hours": rng.uniform(0, 12, n).round(1),
+        "soil_type": rng.choice(np.array(["Loam", "Clay", "Sandy", None], dtype=object), n),
+    })
+
+
+def run(sizes: list[int], modes: list[str], scenarios: list[str]) -> list[dict]:
+    results = []
+    for n in sizes:
+        plants = synthetic_index(n)
+        for scenario in scenarios:
+            for mode in modes:
+                with tempfile.TemporaryDirectory() as tmp:
+                    db_path = Path(tmp) / "Plant.db"
+                    if scenario == "refresh":
+                        persist_sqlite(plants, db_path, mode="bulk")
+                    start = time.perf_counter()
+                    persist_sqlite(plants, db_path, mode=mode)
+                    elapsed = time.perf_counter() - start
+                result = {
+                    "scenario": scenario,
+                    "mode": mode,
+                    "rows": n,
+                    "seconds": round(elapsed, 3),
+                    "rows_per_sec": round(n / elapsed),
+                }
+                print(json.dumps(result), flush=True)
+                results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--modes", nargs="+", default=["upsert", "bulk", "delta"])
+    parser.add_argument("--scenarios", nargs="+", default=["fresh", "refresh"])
+    args = parser.parse_args()
+    run(args.sizes, args.modes, args.scenarios)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Build time and query latency of the fuzzy-search TrigramIndex.
+
+    python benchmarks/bench_trigram.py --sizes 50000 500000 --probe-budget 8192
+
+Names are two or three words drawn from a syllable-built vocabulary, the
+third being one of a few words most names share ("plant", "green"), so some
+trigrams are rare and some appear in a fifth of the index or more. Queries
+are sampled names with one letter changed, plus names made only of the
+common words. With --probe-budget, recall is the share of the exact
+index's top 25 that the budgeted search also returns. Prints one JSON
+object per (size, stage).
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.components.Backend.Repositories.trigram import TrigramIndex  # noqa: E402
+
+SYLLABLES = [c + v for c in "bcdfghklmnprstvwz" for v in "aeiouy"] + ["th", "ch", "sp", "st", "n", "r", "s"]
+COMMON = ["plant", "green", "dwarf"]
+
+
+def synthetic_names(n: int, seed: int = 0) -> list[tuple[int, str]]:
+    rng = np.random.default_rng(seed)
+    vocab = ["".join(rng.choice(SYLLABLES, rng.integers(2, 5))) for _ in range(max(1000, n // 5))]
+    first = rng.choice(vocab, n)
+    second = rng.choice(vocab, n)
+    common = rng.choice(COMMON, n)
+    return [(i + 1, f"{a} {b} {c}" if i % 3 else f"{a} {b}") for i, (a, b, c) in enumerate(zip(first, second, common))]
+
+
+def misspell(name: str, rng: np.random.Generator) -> str:
+    i = int(rng.integers(len(name)))
+    return name[:i] + "x" + name[i + 1:]
+
+
+def run(sizes: list[int], queries: int = 200, seed: int = 0, probe_budget: int = 0) -> list[dict]:
+    results = []
+    rng = np.random.default_rng(seed)
+    for n in sizes:
+        docs = synthetic_names(n, seed)
+        start = time.perf_counter()
+        index = TrigramIndex(docs, probe_budget=probe_budget or None)
+        results.append({"rows": n, "stage": "build", "seconds": round(time.perf_counter() - start, 3)})
+        print(json.dumps(results[-1]), flush=True)
+
+        sample = [misspell(docs[int(i)][1], rng) for i in rng.integers(n, size=queries)]
+        sample += ["plant", "green plant"]  # queries made only of common trigrams
+        timings, hits = [], []
+        for q in sample:
+            start = time.perf_counter()
+            hits.append(index.search(q))
+            timings.append(time.perf_counter() - start)
+        ms = np.array(timings) * 1000
+        results.append({"rows": n, "stage": "search", "queries": len(sample),
+                        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+                        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+                        "max_ms": round(float(ms.max()), 2)})
+        if probe_budget:
+            exact = TrigramIndex(docs)
+            found = [(len({r for r, _ in got} & {r for r, _ in want}), len(want))
+                     for got, want in zip(hits, map(exact.search, sample))]
+            results[-1]["recall"] = round(sum(f for f, _ in found) / max(1, sum(w for _, w in found)), 3)
+        print(json.dumps(results[-1]), flush=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50_000, 500_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--probe-budget", type=int, default=0, help="FUZZY_PROBE_POSTINGS; 0 searches exactly")
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.seed, args.probe_budget)
+
+
+if __name__ == "__main__":
+    main()
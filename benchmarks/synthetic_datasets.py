@@ -0,0 +1,179 @@
+"""
+Synthetic stand-ins for the Kaggle datasets in Cleaning.DATASETS.
+
+    python benchmarks/synthetic_datasets.py data/synthetic --rows 1000000
+    python Cleaning.py --local-dir data/synthetic --no-cache \\
+        --output /tmp/unified.parquet --sqlite /tmp/Plant.db
+
+Writes <out>/<dataset>/<first preferred file> for every dataset, with the
+raw column headers, value kinds (ranges like "10-20", categorical text,
+sparse NaNs) and relative sizes of the real downloads. --rows is the total
+across datasets, split in the proportions of the real unified frame (the
+watering dataset dominates); every dataset gets at least 100 rows. Name
+columns grow with the row count so the plant index grows too.
+"""
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Cleaning import DATASETS  # noqa: E402
+
+# Rows per dataset in the real unified frame
+REAL_ROWS = {
+    "plant_health": 1200,
+    "plant_growth": 193,
+    "auto_irrigation": 200,
+    "crop_water_requirement": 2880,
+    "watering_prediction": 99893,
+    "companion_plants": 990,
+}
+MIN_ROWS = 100
+CHUNK_ROWS = 500_000
+
+
+def _with_nans(rng: np.random.Generator, values: np.ndarray, rate: float) -> np.ndarray:
+    values = values.astype(float)
+    values[rng.random(len(values)) < rate] = np.nan
+    return values
+
+
+def _plant_health(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    plants = max(10, total // 120)
+    u = lambda lo, hi: rng.uniform(lo, hi, n)  # noqa: E731
+    return pd.DataFrame({
+        "Timestamp": (pd.Timestamp("2024-10-03 10:54:53") + pd.to_timedelta(np.arange(start, start + n) * 6, "h"))
+        .astype(str),
+        "Plant_ID": rng.integers(1, plants + 1, n),
+        "Soil_Moisture": u(10, 40),
+        "Ambient_Temperature": u(18, 30),
+        "Soil_Temperature": u(15, 25),
+        "Humidity": u(40, 70),
+        "Light_Intensity": u(200, 1000),
+        "Soil_pH": u(5.5, 7.5),
+        "Nitrogen_Level": u(10, 50),
+        "Phosphorus_Level": u(10, 50),
+        "Potassium_Level": u(10, 50),
+        "Chlorophyll_Content": u(20, 50),
+        "Electrochemical_Signal": u(0, 2),
+        "Plant_Health_Status": rng.choice(["Healthy", "Moderate Stress", "High Stress"], n),
+    })
+
+
+def _plant_growth(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Soil_Type": rng.choice(["loam", "sandy", "clay"], n),
+        "Sunlight_Hours": rng.uniform(4, 10, n),
+        "Water_Frequency": rng.choice(["daily", "weekly", "bi-weekly"], n),
+        "Fertilizer_Type": rng.choice(["chemical", "organic", "none"], n),
+        "Temperature": rng.uniform(15, 35, n),
+        "Humidity": rng.uniform(30, 80, n),
+        "Growth_Milestone": rng.integers(0, 2, n),
+    })
+
+
+def _auto_irrigation(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "crop": np.full(n, "cotton"),
+        "moisture": rng.integers(300, 1000, n),
+        "temp": rng.integers(10, 46, n),
+        "pump": rng.integers(0, 2, n),
+    })
+
+
+def _crop_water_requirement(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    crops = ["BANANA", "SOYABEAN", "CABBAGE", "POTATO", "RICE", "MELON", "MAIZE", "CITRUS",
+             "BEAN", "WHEAT", "MUSTARD", "COTTON", "SUGARCANE", "TOMATO", "ONION"]
+    return pd.DataFrame({
+        "CROP TYPE": rng.choice(crops, n),
+        "SOIL TYPE": rng.choice(["DRY", "HUMID", "WET"], n),
+        "REGION": rng.choice(["DESERT", "SEMI ARID", "SEMI HUMID", "HUMID"], n),
+        # Ranges, as in the real file; Cleaning coerces them to midpoints
+        "TEMPERATURE": rng.choice(["10-20", "20-30", "30-40", "40-50"], n),
+        "WEATHER CONDITION": rng.choice(["NORMAL", "SUNNY", "WINDY", "RAINY"], n),
+        "WATER REQUIREMENT": rng.uniform(0, 30, n).round(2),
+    })
+
+
+def _watering_prediction(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    nan = lambda values: _with_nans(rng, values, 0.05)  # noqa: E731
+    return pd.DataFrame({
+        "Soil Moisture": rng.integers(1, 91, n),
+        "Temperature": rng.integers(0, 46, n),
+        "Soil Humidity": nan(rng.integers(20, 71, n)),
+        "Time": nan(rng.integers(0, 111, n)),
+        "Air temperature (C)": nan(rng.uniform(10, 40, n).round(2)),
+        "Wind speed (Km/h)": nan(rng.uniform(0, 30, n).round(2)),
+        "Air humidity (%)": nan(rng.uniform(10, 100, n).round(2)),
+        "Wind gust (Km/h)": nan(rng.uniform(0, 60, n).round(2)),
+        "Pressure (KPa)": nan(rng.uniform(100, 102, n).round(2)),
+        "ph": nan(rng.uniform(3.5, 9.9, n)),
+        "rainfall": nan(rng.uniform(20, 300, n)),
+        "N": nan(rng.integers(0, 141, n)),
+        "P": nan(rng.integers(5, 146, n)),
+        "K": nan(rng.integers(5, 206, n)),
+        "Status": np.where(rng.random(n) < 0.05, None, rng.choice(["ON", "OFF"], n)),
+    })
+
+
+def _companion_plants(rng: np.random.Generator, n: int, start: int, total: int) -> pd.DataFrame:
+    sources = max(97, total // 10)
+    destinations = max(189, total // 5)
+    return pd.DataFrame({
+        "Source Node": [f"plant {i}" for i in rng.integers(0, sources, n)],
+        "Link": rng.choice(["helps", "helped_by", "avoid"], n),
+        "Destination Node": [f"plant {i}" for i in rng.integers(0, destinations, n)],
+        "Source Type": rng.choice(["vegetables", "herbs", "fruits", "flowers"], n),
+    })
+
+
+GENERATORS: Dict[str, Callable[[np.random.Generator, int, int, int], pd.DataFrame]] = {
+    "plant_health": _plant_health,
+    "plant_growth": _plant_growth,
+    "auto_irrigation": _auto_irrigation,
+    "crop_water_requirement": _crop_water_requirement,
+    "watering_prediction": _watering_prediction,
+    "companion_plants": _companion_plants,
+}
+
+
+def dataset_rows(total: int) -> Dict[str, int]:
+    real_total = sum(REAL_ROWS.values())
+    return {name: max(MIN_ROWS, round(total * real / real_total)) for name, real in REAL_ROWS.items()}
+
+
+def generate(out_dir: Path, rows: int = 10_000, seed: int = 0) -> Dict[str, Path]:
+    """Write every dataset's CSV under out_dir; returns name -> dataset directory."""
+    rng = np.random.default_rng(seed)
+    paths = {}
+    for name, n in dataset_rows(rows).items():
+        target = out_dir / name / DATASETS[name]["preferred_files"][0]  # type: ignore[index]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Written in chunks so 10M-row runs do not hold a whole frame of text
+        for start in range(0, n, CHUNK_ROWS):
+            chunk = GENERATORS[name](rng, min(CHUNK_ROWS, n - start), start, n)
+            chunk.to_csv(target, mode="w" if start == 0 else "a", header=start == 0, index=False)
+        paths[name] = target.parent
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--rows", type=int, default=10_000, help="Total rows across datasets (10k/1M/10M)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for name, path in generate(args.out_dir, args.rows, args.seed).items():
+        print(f"{name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
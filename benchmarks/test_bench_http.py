@@ -0,0 +1,52 @@
+"""
+Throughput regression gate, run explicitly (not part of tests/):
+
+    python benchmarks/bench_http.py --save-baseline benchmarks/baselines/http.json
+    python -m pytest benchmarks/test_bench_http.py
+
+Re-runs the benchmark with the baseline's settings and fails when a
+scenario's req/s drops, or its p99 grows, by more than
+BENCH_REGRESSION_THRESHOLD (default 0.2 = 20%). Baselines are machine
+specific; record one on the machine that runs the gate.
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from bench_http import run
+
+BASELINE = Path(os.getenv("BENCH_HTTP_BASELINE", Path(__file__).parent / "baselines" / "http.json"))
+THRESHOLD = float(os.getenv("BENCH_REGRESSION_THRESHOLD", "0.2"))
+
+
+@pytest.fixture(scope="module")
+def comparison():
+    if not BASELINE.exists():
+        pytest.skip(f"no baseline at {BASELINE}; record one with bench_http.py --save-baseline")
+    baseline = json.loads(BASELINE.read_text())
+    current = run(**baseline["settings"])
+    return baseline, current
+
+
+def _by_scenario(report):
+    return {r["scenario"]: r for r in report["results"]}
+
+
+def test_no_errors(comparison):
+    _, current = comparison
+    assert {r["scenario"]: r["errors"] for r in current["results"] if r["errors"]} == {}
+
+
+def test_throughput_and_tail_latency_within_threshold(comparison):
+    baseline, current = comparison
+    now = _by_scenario(current)
+    regressions = []
+    for scenario, before in _by_scenario(baseline).items():
+        after = now[scenario]
+        if after["rps"] < before["rps"] * (1 - THRESHOLD):
+            regressions.append(f"{scenario}: {before['rps']} -> {after['rps']} req/s")
+        if after["p99_ms"] > before["p99_ms"] * (1 + THRESHOLD):
+            regressions.append(f"{scenario}: p99 {before['p99_ms']} -> {after['p99_ms']} ms")
+    assert not regressions, "; ".join(regressions)
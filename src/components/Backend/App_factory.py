@@ -1,10 +1,15 @@
+import logging
+import sqlite3
 from flask import Flask
 from .config import SECRET_KEY, FLASK_ENV
 from .Repositories.db import close_db, init_db, PlantsRepository
 from .Metrics.prometheus import before_request as metrics_before, after_request as metrics_after
 from .Routes.auth import create_auth_bp, AuthService
+from .Routes.pages import create_pages_bp
 from .Routes.plants import create_plants_bp
 
+logger = logging.getLogger(__name__)
+
 def create_app(config: dict | None = None, services: dict | None = None):
     services = services or {}
     app = Flask(__name__)
@@ -28,14 +33,34 @@ def create_app(config: dict | None = None, services: dict | None = None):
 
     # Blueprints
     from .Routes.health import bp as health_bp
-    from .Routes.pages import bp as pages_bp
 
     auth_service = services.get("auth_service") or AuthService()
     plants_repo = services.get("plants_repo") or PlantsRepository()
+    static_assets = services.get("static_assets")
+
+    # Accounts schema is created at startup, not as an import side effect
+    auth_service.init_db()
 
     app.register_blueprint(health_bp)
-    app.register_blueprint(pages_bp)
+    app.register_blueprint(create_pages_bp(static_assets))
     app.register_blueprint(create_auth_bp(auth_service))
     app.register_blueprint(create_plants_bp(plants_repo))
 
+    app.extensions["plants_repo"] = plants_repo
+    app.extensions["auth_service"] = auth_service
     return app
+
+def warm_up(app: Flask) -> None:
+    """
+    Pay per-process cold-start costs before serving traffic: open a pooled
+    Plant.db connection, check the FTS index, build the trigram index and
+    import bcrypt. Called by gunicorn in each worker after fork.
+    """
+    repo = app.extensions["plants_repo"]
+    try:
+        with app.app_context():  # teardown hands the connection back to the pool
+            repo.search("a")
+            repo.trigram_index()
+    except (sqlite3.Error, ValueError) as exc:
+        logger.warning("Plant search warm-up skipped: %s", exc)
+    app.extensions["auth_service"].warm_up()
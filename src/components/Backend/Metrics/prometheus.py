@@ -1,16 +1,100 @@
+import os
+import threading
 import time
 import logging
+from collections import deque
 from flask import g, request, Response
+from ..config import HTTP_LATENCY_BUCKETS, LATENCY_QUANTILE_ENDPOINTS, LATENCY_QUANTILE_WINDOW, SLOW_QUERY_MS
+
+# Label used for requests that matched no route (404 probes, scanners), so
+# arbitrary paths never become label values
+UNMATCHED_ENDPOINT = "unmatched"
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+class LatencyQuantiles:
+    """
+    p50/p95/p99 over a sliding window of recent requests, per endpoint, for
+    the endpoints listed in LATENCY_QUANTILE_ENDPOINTS. Computed per worker
+    at scrape time; unlike histogram buckets they cannot be summed across
+    workers, so treat them as a per-process view.
+    """
+    quantiles = (0.5, 0.95, 0.99)
+
+    def __init__(self, endpoints=LATENCY_QUANTILE_ENDPOINTS, window: int = LATENCY_QUANTILE_WINDOW):
+        self.endpoints = endpoints
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        if endpoint not in self.endpoints:
+            return
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def snapshot(self) -> dict[str, dict[float, float]]:
+        with self._lock:
+            windows = {e: sorted(s) for e, s in self._samples.items() if s}
+        return {
+            e: {q: s[min(len(s) - 1, int(q * len(s)))] for q in self.quantiles}
+            for e, s in windows.items()
+        }
+
+    def collect(self):
+        from prometheus_client.core import GaugeMetricFamily
+        family = GaugeMetricFamily(
+            "http_request_duration_window_seconds",
+            f"Latency quantiles over the last {self.window} requests (this worker)",
+            labels=["endpoint", "quantile"],
+        )
+        for endpoint, values in self.snapshot().items():
+            for q, v in values.items():
+                family.add_metric([endpoint, str(q)], v)
+        yield family
+
+latency_quantiles = LatencyQuantiles()
 
 try:
-    from prometheus_client import Counter, Histogram, REGISTRY, generate_latest, CONTENT_TYPE_LATEST
+    from prometheus_client import (
+        CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest, CONTENT_TYPE_LATEST, multiprocess,
+    )
     http_requests = Counter("http_requests_total", "HTTP requests", ["method", "endpoint", "status"])
     http_latency = Histogram(
         "http_request_duration_seconds",
         "Latency sec",
         ["method", "endpoint", "status"],
-        buckets=[0.05, 0.1, 0.3, 0.5, 1, 2, 5],
+        buckets=HTTP_LATENCY_BUCKETS,
+    )
+    REGISTRY.register(latency_quantiles)
+    search_cache_events = Counter("plants_search_cache_total", "Plant search cache events", ["event"])
+    auth_hash_wait = Histogram(
+        "auth_hash_queue_wait_seconds",
+        "Time a password hash/check waited for a hashing thread",
+        ["op"],
+        buckets=[0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+    )
+    auth_hash_duration = Histogram(
+        "auth_hash_duration_seconds",
+        "Password hash/check time on a hashing thread",
+        ["op"],
+        buckets=[0.05, 0.1, 0.2, 0.3, 0.5, 1, 2],
     )
+    db_query_duration = Histogram(
+        "db_query_duration_seconds",
+        "SQLite query time, execute through fetch",
+        ["db", "query"],
+        buckets=[0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1],
+    )
+    db_query_rows = Histogram(
+        "db_query_rows",
+        "Rows returned or written per SQLite query",
+        ["db", "query"],
+        buckets=[0, 1, 5, 10, 25, 50, 100, 250, 1000, 10000, 100000],
+    )
+    auth_hash_rejected = Counter("auth_hash_rejected_total", "Auth requests rejected with 503, hashing pool full", ["op"])
 except ImportError:
     class _Noop:
         def labels(self, *_, **__):
@@ -20,7 +104,9 @@ except ImportError:
         def observe(self, *_, **__):
             return None
 
-    http_requests = http_latency = _Noop()
+    http_requests = http_latency = search_cache_events = _Noop()
+    auth_hash_wait = auth_hash_duration = auth_hash_rejected = _Noop()
+    db_query_duration = db_query_rows = _Noop()
     REGISTRY = None
     CONTENT_TYPE_LATEST = "text/plain"
     logging.warning("prometheus_client not installed; metrics middleware disabled")
@@ -28,16 +114,67 @@ except ImportError:
     def generate_latest(_=None) -> bytes:
         return b"metrics_disabled"
 
+def multiprocess_dir() -> str | None:
+    """
+    Shared metrics directory when running under several gunicorn workers.
+    prometheus_client switches to file-backed values when this variable is
+    set before it is imported, so it must be set in the server environment
+    (see gunicorn_conf.py), not by the app.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+def _registry():
+    if REGISTRY is None or not multiprocess_dir():
+        return REGISTRY
+    # Fresh registry per scrape: aggregates the files of every worker
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(latency_quantiles)
+    return registry
+
+slow_query_log = logging.getLogger("db.slow_query")
+
+class timed_query:
+    """
+    Times one SQLite query, from execute through the last fetch:
+
+        with timed_query("plants", "search_like") as q:
+            rows = con.execute(...).fetchall()
+            q.rows = len(rows)
+
+    Queries over SLOW_QUERY_MS are logged to "db.slow_query".
+    """
+    def __init__(self, db: str, query: str):
+        self.db = db
+        self.query = query
+        self.rows = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_):
+        elapsed = time.perf_counter() - self._start
+        db_query_duration.labels(self.db, self.query).observe(elapsed)
+        if exc_type is None:
+            db_query_rows.labels(self.db, self.query).observe(self.rows)
+        if elapsed * 1000 >= SLOW_QUERY_MS:
+            slow_query_log.warning("slow query %s.%s: %.1f ms, %d rows%s", self.db, self.query,
+                                   elapsed * 1000, self.rows, " (failed)" if exc_type else "")
+        return False
+
 def before_request():
     g._start = time.perf_counter()
 
 def after_request(resp):
     dur = time.perf_counter() - getattr(g, "_start", time.perf_counter())
     status = str(resp.status_code)
-    endpoint = request.endpoint or request.path
-    http_requests.labels(request.method, endpoint, status).inc()
-    http_latency.labels(request.method, endpoint, status).observe(dur)
+    endpoint = request.endpoint or UNMATCHED_ENDPOINT
+    method = request.method if request.method in KNOWN_METHODS else "OTHER"
+    http_requests.labels(method, endpoint, status).inc()
+    http_latency.labels(method, endpoint, status).observe(dur)
+    latency_quantiles.observe(endpoint, dur)
     return resp
 
 def metrics():
-    return Response(generate_latest(REGISTRY), mimetype=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(_registry()), mimetype=CONTENT_TYPE_LATEST)
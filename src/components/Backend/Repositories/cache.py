@@ -0,0 +1,76 @@
+from __future__ import annotations
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+from ..Metrics.prometheus import search_cache_events
+
+def db_version(db_path: Path) -> tuple:
+    """
+    Cheap change token for a SQLite file: (mtime_ns, size) of the main file and
+    its WAL. Any committed write changes one of them, so a cached result tagged
+    with an older token is stale. An empty WAL (created by merely opening a
+    connection) counts as no WAL.
+    """
+    token = []
+    for p in (db_path, Path(f"{db_path}-wal")):
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            token.append(None)
+            continue
+        token.append((st.st_mtime_ns, st.st_size) if st.st_size else None)
+    return tuple(token)
+
+class SearchCache:
+    """Bounded LRU cache with per-entry TTL, invalidated when the DB version changes."""
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._version: tuple | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self, version: tuple) -> None:
+        if version != self._version:
+            if self._entries:
+                search_cache_events.labels("invalidation").inc()
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable, version: tuple) -> Any | None:
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, rows = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    search_cache_events.labels("hit").inc()
+                    return rows
+                del self._entries[key]
+        search_cache_events.labels("miss").inc()
+        return None
+
+    def put(self, key: Hashable, version: tuple, rows: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (self._clock() + self.ttl, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                search_cache_events.labels("eviction").inc()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
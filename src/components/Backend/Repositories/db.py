@@ -1,9 +1,27 @@
 from __future__ import annotations
+import base64
+import json
 import os
+import re
 import sqlite3
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 from flask import g
-from ..config import PLANT_DB_PATH
+from ..config import (
+    FUZZY_PROBE_POSTINGS,
+    PLANT_DB_CACHE_KIB,
+    PLANT_DB_MMAP_SIZE,
+    PLANT_DB_PATH,
+    PLANT_DB_POOL_SIZE,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+)
+from ..Metrics.prometheus import timed_query
+from .cache import SearchCache, db_version
+
+if TYPE_CHECKING:
+    from .trigram import TrigramIndex
 
 def _connect(db_path: Path) -> sqlite3.Connection:
     con = sqlite3.connect(db_path, check_same_thread=False)
@@ -14,22 +32,86 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     con.execute("PRAGMA synchronous = NORMAL;")
     return con
 
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    # as_uri() percent-escapes "#", "?" and "%" in the path
+    con = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    con.row_factory = sqlite3.Row
+    # Read-path tuning, applied once per pooled connection
+    con.execute(f"PRAGMA mmap_size = {PLANT_DB_MMAP_SIZE};")
+    con.execute(f"PRAGMA cache_size = -{PLANT_DB_CACHE_KIB};")
+    con.execute("PRAGMA query_only = ON;")
+    return con
+
 def resolve_db_path(db_path: Path | None = None) -> Path:
     override = os.getenv("PLANT_DB_PATH")
     return Path(db_path or override or PLANT_DB_PATH)
 
+class ConnectionPool:
+    """
+    Per-worker pool of read-only connections to one database file.
+    Requests borrow a connection and hand it back on teardown; at most `size`
+    idle connections are kept, extra ones opened under load are closed on
+    release. A pool inherited across fork() starts over in the child.
+    """
+    def __init__(self, db_path: Path, size: int = PLANT_DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._pid = os.getpid()
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._pid != os.getpid():
+                # SQLite handles must not cross fork(); drop without closing
+                self._idle = []
+                self._pid = os.getpid()
+            if self._idle:
+                return self._idle.pop()
+        return _connect_readonly(self.db_path)
+
+    def release(self, con: sqlite3.Connection) -> None:
+        if con.in_transaction:
+            con.rollback()
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.size:
+                self._idle.append(con)
+                return
+        con.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for con in idle:
+            con.close()
+
+_pools: dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path: Path | None = None) -> ConnectionPool:
+    target = resolve_db_path(db_path)
+    pool = _pools.get(target)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(target, ConnectionPool(target))
+    return pool
+
 def get_db(db_path: Path | None = None) -> sqlite3.Connection:
-    """One connection per request context."""
+    """One pooled read-only connection per request context."""
     if "db" not in g:
-        target = resolve_db_path(db_path)
-        target.parent.mkdir(parents=True, exist_ok=True)
-        g.db = _connect(target)
+        pool = get_pool(db_path)
+        g.db = pool.acquire()
+        g.db_pool = pool
     return g.db
 
 def close_db(_=None) -> None:
     con = g.pop("db", None)
+    pool = g.pop("db_pool", None)
     if con is not None:
-        con.close()
+        if pool is not None:
+            pool.release(con)
+        else:
+            con.close()
 
 def init_db(schema_path: Path | None = None, db_path: Path | None = None) -> None:
     """
@@ -44,21 +126,214 @@ def init_db(schema_path: Path | None = None, db_path: Path | None = None) -> Non
             con.executescript(f.read())
         con.close()
 
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def fts_match_expression(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 prefix query: "rose mar" -> '"rose"* "mar"*'.
+    Tokens are quoted so user input can never inject FTS5 operators.
+    Returns None when the query has no searchable tokens.
+    """
+    tokens = _FTS_TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{t}"*' for t in tokens)
+
 class PlantsRepository:
     """Thin repository wrapper to allow DI and testing."""
-    def __init__(self, db_path: Path | None = None):
+    def __init__(self, db_path: Path | None = None, cache: SearchCache | None = None):
         self.db_path = db_path
+        self.cache = cache if cache is not None else SearchCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+        self._trigram_lock = threading.Lock()
+        self._trigram: tuple[tuple, TrigramIndex] | None = None
+        self._fts_ready: tuple[tuple, bool] | None = None
+
+    def search(self, query: str, limit: int = 25, fuzzy: bool = False) -> list[dict]:
+        return self.search_page(query, limit, fuzzy=fuzzy)[0]
+
+    def search_page(
+        self, query: str, limit: int = 25, cursor: str | None = None, fuzzy: bool = False
+    ) -> tuple[list[dict], str | None]:
+        """
+        One page of results plus an opaque cursor for the next page (None at the end).
+        Pages are keyset-based; fuzzy results are a single ranked page.
+        Raises ValueError for a malformed cursor.
+        """
+        query = " ".join(query.lower().split())
+        after = decode_cursor(cursor) if cursor else None
+        key = (query, limit, cursor, fuzzy)
+        version = db_version(resolve_db_path(self.db_path))
+        page = self.cache.get(key, version)
+        if page is None:
+            if fuzzy:
+                page = (self._search_fuzzy(query, limit, version), None)
+            else:
+                page = self._search(query, limit, after, version)
+            self.cache.put(key, version, page)
+        return page
+
+    def get_many(self, names: list[str]) -> list[dict]:
+        """Exact-name lookup for many plants in one statement, returned in request order."""
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        with timed_query("plants", "get_many") as q:
+            rows = get_db(self.db_path).execute(
+                f"""
+                SELECT name, water_frequency, sunlight_hours, soil_type
+                FROM plants
+                WHERE name IN ({", ".join("?" * len(names))})
+                """,
+                names,
+            ).fetchall()
+            q.rows = len(rows)
+        by_name = {r["name"]: dict(r) for r in rows}
+        return [by_name[n] for n in names if n in by_name]
+
+    def trigram_index(self, version: tuple | None = None) -> TrigramIndex:
+        """Build the name trigram index once per worker; rebuild only when Plant.db changes."""
+        from .trigram import TrigramIndex  # numpy-backed; keep it off the import path
+        if version is None:
+            version = db_version(resolve_db_path(self.db_path))
+        with self._trigram_lock:
+            if self._trigram is None or self._trigram[0] != version:
+                with timed_query("plants", "trigram_names") as q:
+                    rows = get_db(self.db_path).execute("SELECT rowid, name FROM plants").fetchall()
+                    q.rows = len(rows)
+                self._trigram = (version, TrigramIndex(rows, probe_budget=FUZZY_PROBE_POSTINGS or None))
+            return self._trigram[1]
 
-    def search(self, query: str, limit: int = 25) -> list[dict]:
+    def _search_fuzzy(self, query: str, limit: int, version: tuple) -> list[dict]:
+        ranked = self.trigram_index(version).search(query, limit)
+        if not ranked:
+            return []
+        rowids = [rowid for rowid, _ in ranked]
+        with timed_query("plants", "fuzzy_rows") as q:
+            found = get_db(self.db_path).execute(
+                f"""
+                SELECT rowid, name, water_frequency, sunlight_hours, soil_type
+                FROM plants
+                WHERE rowid IN ({", ".join("?" * len(rowids))})
+                """,
+                rowids,
+            ).fetchall()
+            q.rows = len(found)
+        by_rowid = {r["rowid"]: r for r in found}
+        rows = []
+        for rowid, score in ranked:
+            r = by_rowid.get(rowid)
+            if r is not None:
+                row = dict(r)
+                del row["rowid"]
+                row["score"] = round(score, 3)
+                rows.append(row)
+        return rows
+
+    def fts_ready(self, con: sqlite3.Connection, version: tuple) -> bool:
+        """
+        True when plants_fts exists and indexes every plant. Plant.db files
+        written by older ETL runs have the table but an empty index; those
+        must keep using LIKE. Checked once per DB version.
+        """
+        if self._fts_ready is None or self._fts_ready[0] != version:
+            try:
+                with timed_query("plants", "fts_docsize_count") as q:
+                    indexed = con.execute("SELECT count(*) FROM plants_fts_docsize").fetchone()[0]
+                    q.rows = 1
+                with timed_query("plants", "plants_count") as q:
+                    ready = indexed == con.execute("SELECT count(*) FROM plants").fetchone()[0]
+                    q.rows = 1
+            except sqlite3.OperationalError:
+                ready = False
+            self._fts_ready = (version, ready)
+        return self._fts_ready[1]
+
+    def _search(
+        self, query: str, limit: int, after: tuple | None, version: tuple
+    ) -> tuple[list[dict], str | None]:
         con = get_db(self.db_path)
-        cur = con.cursor()
-        cur.execute(
-            """
-            SELECT name, water_frequency, sunlight_hours, soil_type
-            FROM plants
-            WHERE name LIKE ? COLLATE NOCASE
-            LIMIT ?
-            """,
-            (f"%{query}%", limit),
-        )
-        return [dict(r) for r in cur.fetchall()]
+        match = fts_match_expression(query)
+        if match is not None and (after is None or after[0] == "fts") and self.fts_ready(con, version):
+            try:
+                return self._search_fts(con, match, limit, after)
+            except sqlite3.OperationalError as exc:
+                # Older Plant.db files (or SQLite builds) without plants_fts
+                if "plants_fts" not in str(exc) and "fts5" not in str(exc):
+                    raise
+        if after is not None and after[0] != "like":
+            raise ValueError("cursor does not belong to this search")
+        return self._search_like(con, query, limit, after)
+
+    def _search_fts(
+        self, con: sqlite3.Connection, match: str, limit: int, after: tuple | None
+    ) -> tuple[list[dict], str | None]:
+        keyset = ""
+        params: list = [match]
+        if after is not None:
+            _, score, rowid = after
+            keyset = "AND (bm25(plants_fts) > ? OR (bm25(plants_fts) = ? AND p.rowid > ?))"
+            params += [score, score, rowid]
+        with timed_query("plants", "search_fts") as q:
+            rows = con.execute(
+                f"""
+                SELECT p.name, p.water_frequency, p.sunlight_hours, p.soil_type,
+                       bm25(plants_fts) AS _score, p.rowid AS _rowid
+                FROM plants_fts
+                JOIN plants AS p ON p.rowid = plants_fts.rowid
+                WHERE plants_fts MATCH ? {keyset}
+                ORDER BY _score, _rowid
+                LIMIT ?
+                """,
+                (*params, limit + 1),
+            ).fetchall()
+            q.rows = len(rows)
+        return _keyset_page(rows, limit, "fts", "_score")
+
+    def _search_like(
+        self, con: sqlite3.Connection, query: str, limit: int, after: tuple | None
+    ) -> tuple[list[dict], str | None]:
+        keyset = ""
+        params: list = [f"%{query}%"]
+        if after is not None:
+            _, name, rowid = after
+            keyset = "AND (name > ? OR (name = ? AND rowid > ?))"
+            params += [name, name, rowid]
+        with timed_query("plants", "search_like") as q:
+            rows = con.execute(
+                f"""
+                SELECT name, water_frequency, sunlight_hours, soil_type,
+                       name AS _name, rowid AS _rowid
+                FROM plants
+                WHERE name LIKE ? COLLATE NOCASE {keyset}
+                ORDER BY name, rowid
+                LIMIT ?
+                """,
+                (*params, limit + 1),
+            ).fetchall()
+            q.rows = len(rows)
+        return _keyset_page(rows, limit, "like", "_name")
+
+def encode_cursor(kind: str, key, rowid: int) -> str:
+    raw = json.dumps([kind, key, rowid], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        kind, key, rowid = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    if kind not in ("fts", "like") or not isinstance(rowid, int):
+        raise ValueError("invalid cursor")
+    return kind, key, rowid
+
+def _keyset_page(rows: list[sqlite3.Row], limit: int, kind: str, key_col: str) -> tuple[list[dict], str | None]:
+    """Strip the sort-key columns and build the next cursor from the last returned row."""
+    page = [dict(r) for r in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit and page:
+        last = page[-1]
+        next_cursor = encode_cursor(kind, last[key_col], last["_rowid"])
+    for row in page:
+        del row[key_col], row["_rowid"]
+    return page, next_cursor
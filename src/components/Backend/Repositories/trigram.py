@@ -0,0 +1,180 @@
+from __future__ import annotations
+import itertools
+import math
+import re
+from array import array
+from typing import Iterable
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+def _word_trigrams(word: str) -> list[str]:
+    padded = f"  {word} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+def trigrams(text: str) -> set[str]:
+    """pg_trgm-style trigrams: lowercased words padded with two leading and one trailing blank."""
+    out: set[str] = set()
+    for word in _WORD_RE.findall(text.lower()):
+        out.update(_word_trigrams(word))
+    return out
+
+class TrigramIndex:
+    """
+    In-memory trigram index over plant names.
+    Postings are stored CSR-style: one uint32 array of document ids per
+    trigram plus a trigram -> (id, start, end) slice table, and a forward index
+    lists each name's trigram ids the same way, so a large index costs a few
+    bytes per posting. Names are numbered by trigram count, so each postings
+    list runs from the shortest names to the longest. A query collects
+    candidates from its rarest trigrams and scores them exactly against the
+    forward index.
+    With `probe_budget` set, candidate collection stops after that many
+    postings, cutting lists from their long-name end, and only the
+    probe_budget // 16 names seen in the most lists are scored: the best
+    match is almost always kept and every returned score is exact, but
+    weaker matches can be missed. None reads every list a hit could come
+    from and returns exactly what a full scan would.
+    """
+    def __init__(self, docs: Iterable[tuple[int, str]], probe_budget: int | None = None):
+        self._probe_budget = probe_budget
+        # Python only maps each name to word ids; trigrams are worked out once
+        # per distinct word and fanned out to names with numpy.
+        word_ids: dict[str, int] = {}
+        doc_words = array("I")
+        n_words = array("q")
+        rowids = array("q")
+        for rowid, name in docs:
+            words = _WORD_RE.findall(name.lower()) if name else ()
+            rowids.append(rowid)
+            n_words.append(len(words))
+            doc_words.extend([word_ids.setdefault(w, len(word_ids)) for w in words])
+
+        gram_ids: dict[str, int] = {}
+        word_grams = [[gram_ids.setdefault(g, len(gram_ids)) for g in _word_trigrams(w)] for w in word_ids]
+        lens = np.fromiter(map(len, word_grams), dtype=np.int64, count=len(word_grams))
+        gram_dtype = np.uint16 if len(gram_ids) <= 1 << 16 else np.uint32  # uint16 sorts by radix
+        flat = np.fromiter(itertools.chain.from_iterable(word_grams), dtype=gram_dtype, count=int(lens.sum()))
+        words = np.frombuffer(doc_words, dtype=np.uint32)
+        per_word = lens[words]
+        grams = flat[_ranges(np.cumsum(lens)[words] - per_word, per_word)]
+        doc = np.repeat(np.repeat(np.arange(len(rowids), dtype=np.uint32), n_words), per_word)
+        # Names are in doc order, so a stable sort by trigram leaves each
+        # trigram's postings contiguous with doc ids ascending; a trigram
+        # repeated across a name's words is then an adjacent duplicate.
+        order = np.argsort(grams, kind="stable")
+        dup = np.zeros(len(doc), dtype=bool)
+        dup[1:] = (grams[order[1:]] == grams[order[:-1]]) & (doc[order[1:]] == doc[order[:-1]])
+        keep = np.ones(len(doc), dtype=bool)
+        keep[order[dup]] = False
+        grams, doc = grams[keep], doc[keep]  # still in doc order
+        sizes = np.bincount(doc, minlength=len(rowids))
+
+        # Renumber names by size and lay the forward index out in that order
+        by_size = np.argsort(sizes, kind="stable")
+        self._sizes = sizes[by_size].astype(np.uint16)
+        self._rowids = np.frombuffer(rowids, dtype=np.int64)[by_size]
+        # names with k trigrams are ids _size_starts[k] up to _size_starts[k + 1]
+        self._size_starts = np.searchsorted(self._sizes, np.arange(int(self._sizes.max(initial=0)) + 2)).tolist()
+        self._offsets = np.concatenate(([0], np.cumsum(self._sizes, dtype=np.int64)))
+        self._forward = grams[_ranges((np.cumsum(sizes) - sizes)[by_size], self._sizes.astype(np.int64))]
+        doc = np.repeat(np.arange(len(rowids), dtype=np.uint32), self._sizes)
+        order = np.argsort(self._forward, kind="stable")
+        self._postings = doc[order]
+        self._n_grams = len(gram_ids)
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(self._forward, minlength=len(gram_ids))))).tolist()
+        self._slices: dict[str, tuple[int, int, int]] = {
+            g: (i, bounds[i], bounds[i + 1]) for g, i in gram_ids.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._rowids)
+
+    def search(self, query: str, limit: int = 25, threshold: float = 0.3) -> list[tuple[int, float]]:
+        """Return up to `limit` (rowid, similarity) pairs, best first, above `threshold`."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        # similarity <= shared / len(grams), so a hit shares at least `need`
+        # trigrams with the query and therefore at least one of its
+        # len(grams) - need + 1 rarest; trigrams missing from the index count
+        # as the rarest of all.
+        n = len(grams)
+        need = max(1, math.ceil(threshold * n - 1e-9))
+        found = sorted((s for s in map(self._slices.get, grams) if s is not None), key=lambda s: s[2] - s[1])
+        probe = len(found) - need + 1
+        if probe <= 0:
+            return []
+        # ... and has between need and n / threshold trigrams of its own
+        largest = len(self._size_starts) - 1
+        lo = np.uint32(self._size_starts[min(need, largest)])
+        hi = np.uint32(self._size_starts[min(int(n / threshold + 1e-9) + 1, largest)] if threshold > 0 else len(self))
+        parts = []
+        budget = self._probe_budget
+        for _, a, b in found[:probe]:
+            # Postings are in doc order and docs in size order, so the
+            # candidates of the right size are one slice of each list.
+            postings = self._postings[a:b]
+            postings = postings[np.searchsorted(postings, lo):np.searchsorted(postings, hi)]
+            if budget is not None:
+                postings = postings[:budget]
+                budget -= len(postings)
+            parts.append(postings)
+            if budget == 0:
+                break
+        ids = np.concatenate(parts)
+        exact = self._probe_budget is None
+        if exact and len(ids) * 4 > len(self):
+            # Even the rarest trigrams cover much of the index: one count per
+            # name over every list beats sorting and scoring candidates
+            for _, a, b in found[probe:]:
+                postings = self._postings[a:b]
+                parts.append(postings[np.searchsorted(postings, lo):np.searchsorted(postings, hi)])
+            shared = np.bincount(np.concatenate(parts), minlength=len(self))
+            candidates = np.flatnonzero(shared >= need)
+            counts = shared[candidates]
+        else:
+            candidates = self._prune(ids, n, found, probe, threshold, exact)
+            counts = self._shared(candidates, found)
+        sizes = self._sizes[candidates].astype(np.int64)
+        # Jaccard similarity over trigram sets, as pg_trgm's similarity()
+        scores = counts / (n + sizes - counts)
+        keep = scores >= threshold
+        candidates, scores = candidates[keep], scores[keep]
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            candidates, scores = candidates[top], scores[top]
+        rowids = self._rowids[candidates]
+        order = np.lexsort((rowids, -scores))
+        return [(int(rowids[i]), float(scores[i])) for i in order]
+
+    def _prune(self, ids: np.ndarray, n: int, found: list, probe: int, threshold: float, exact: bool) -> np.ndarray:
+        """Distinct names among the probed postings `ids` that are worth scoring."""
+        ids.sort()
+        first = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else ids
+        candidates = ids[first]
+        seen = np.diff(np.r_[first, len(ids)])
+        if exact:
+            # A name can still share every trigram not probed; similarity >=
+            # threshold needs shared >= threshold * (n + size) / (1 + threshold)
+            required = threshold * (n + self._sizes[candidates].astype(np.float64)) / (1 + threshold) - 1e-9
+            return candidates[seen + (len(found) - probe) >= required]
+        keep = max(1, self._probe_budget // 16)
+        if len(candidates) > keep:
+            # Score only the names seen in the most probed lists
+            candidates = np.sort(candidates[np.argpartition(-seen, keep - 1)[:keep]])
+        return candidates
+
+    def _shared(self, candidates: np.ndarray, found: list) -> np.ndarray:
+        """Number of the query's trigrams `found` in each candidate, from the forward index."""
+        wanted = np.zeros(self._n_grams, dtype=bool)
+        wanted[[i for i, _, _ in found]] = True
+        sizes = self._sizes[candidates].astype(np.int64)
+        hits = wanted[self._forward[_ranges(self._offsets[candidates], sizes)]].view(np.uint8)
+        return np.add.reduceat(hits, np.cumsum(sizes) - sizes, dtype=np.int64) if len(hits) else sizes
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenated np.arange(start, start + length) for each pair."""
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - ends + lengths, lengths)
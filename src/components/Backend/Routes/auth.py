@@ -1,9 +1,68 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, request, jsonify, redirect, url_for
+from ..config import AUTH_HASH_MAX_PENDING, AUTH_HASH_RETRY_AFTER, AUTH_HASH_WORKERS
+from ..Metrics.prometheus import auth_hash_duration, auth_hash_rejected, auth_hash_wait
+
+
+class HashingBusy(RuntimeError):
+    """Raised when every hashing thread is busy and the wait queue is full."""
+    def __init__(self, retry_after: int):
+        super().__init__("password hashing pool is saturated")
+        self.retry_after = retry_after
+
+
+class HashingExecutor:
+    """
+    Runs bcrypt-bound auth calls on a small dedicated thread pool, so a burst
+    of logins cannot take every request thread away from the rest of the app
+    (bcrypt releases the GIL while hashing). At most workers + max_pending
+    calls are admitted; further calls fail fast with HashingBusy.
+    """
+    def __init__(self, workers: int = AUTH_HASH_WORKERS, max_pending: int = AUTH_HASH_MAX_PENDING,
+                 retry_after: int = AUTH_HASH_RETRY_AFTER):
+        self.workers = max(1, workers)
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, max_pending))
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            # Threads do not survive fork; a pre-fork pool is rebuilt per worker
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="auth-hash")
+                self._pid = os.getpid()
+            return self._pool
+
+    def run(self, op: str, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            auth_hash_rejected.labels(op).inc()
+            raise HashingBusy(self.retry_after)
+        queued = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            auth_hash_wait.labels(op).observe(started - queued)
+            try:
+                return fn(*args)
+            finally:
+                auth_hash_duration.labels(op).observe(time.perf_counter() - started)
+
+        try:
+            return self._executor().submit(job).result()
+        finally:
+            self._slots.release()
+
 
 class AuthService:
     """Thin wrapper around src.data.Auth to allow DI/mocking."""
-    def __init__(self, impl=None):
+    def __init__(self, impl=None, executor: HashingExecutor | None = None):
         self._impl = impl
+        self.executor = executor or HashingExecutor()
 
     @property
     def impl(self):
@@ -15,11 +74,23 @@ class AuthService:
     def init_db(self):
         return self.impl.init_db()
 
+    def warm_up(self) -> None:
+        # Imports src.data.Auth (and bcrypt) now rather than on the first login
+        self._impl = self.impl
+
     def create_user(self, username: str, email: str, password: str):
-        return self.impl.create_user(username, email, password)
+        return self.executor.run("signup", self.impl.create_user, username, email, password)
 
     def authenticate_user(self, email: str, password: str) -> bool:
-        return self.impl.authenticate_user(email, password)
+        return self.executor.run("login", self.impl.authenticate_user, email, password)
+
+
+def _busy(exc: HashingBusy):
+    resp = jsonify({"error": "Server busy, please retry"})
+    resp.status_code = 503
+    resp.headers["Retry-After"] = str(exc.retry_after)
+    return resp
+
 
 def create_auth_bp(auth_service: AuthService) -> Blueprint:
     bp = Blueprint("auth", __name__)
@@ -40,6 +111,8 @@ def create_auth_bp(auth_service: AuthService) -> Blueprint:
             auth_service.create_user(username, email, password)
         except ValueError as exc:
             return jsonify({"error": str(exc)}), 409
+        except HashingBusy as exc:
+            return _busy(exc)
 
         return redirect(url_for("pages.login_form"))
 
@@ -51,7 +124,11 @@ def create_auth_bp(auth_service: AuthService) -> Blueprint:
         if not email or not password:
             return jsonify({"error": "Email and password are required"}), 400
 
-        if not auth_service.authenticate_user(email, password):
+        try:
+            ok = auth_service.authenticate_user(email, password)
+        except HashingBusy as exc:
+            return _busy(exc)
+        if not ok:
             return jsonify({"error": "Invalid credentials"}), 401
 
         return redirect(url_for("pages.dashboard"))
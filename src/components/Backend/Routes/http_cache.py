@@ -0,0 +1,60 @@
+import gzip
+import hashlib
+import logging
+from flask import Response, request
+from ..config import COMPRESS_MIN_BYTES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+    logging.info("brotli not installed; responses will only be gzip-compressed")
+
+def make_etag(*parts, weak: bool = False) -> str:
+    """Stable ETag from any repr-able parts (DB version, query args, content hash...)."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+def not_modified(etag: str) -> Response | None:
+    """304 response when the request's If-None-Match already covers `etag`, else None."""
+    tag = etag.removeprefix("W/").strip('"')
+    if request.if_none_match.contains_weak(tag):
+        resp = Response(status=304)
+        resp.headers["ETag"] = etag
+        resp.vary.add("Accept-Encoding")
+        return resp
+    return None
+
+def choose_encoding() -> str | None:
+    """Best encoding we can produce that the client accepts (br > gzip)."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality("br") > 0:
+        return "br"
+    if accepted.quality("gzip") > 0:
+        return "gzip"
+    return None
+
+def encode(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """Per-response levels by default; best=True for bodies compressed once and reused."""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else 5)
+    return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+
+def compress_response(resp: Response) -> Response:
+    """after_request hook: negotiate gzip/br for buffered bodies above COMPRESS_MIN_BYTES."""
+    if (
+        resp.status_code != 200
+        or resp.direct_passthrough
+        or "Content-Encoding" in resp.headers
+    ):
+        return resp
+    resp.vary.add("Accept-Encoding")
+    body = resp.get_data()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return resp
+    encoding = choose_encoding()
+    if encoding is None:
+        return resp
+    resp.set_data(encode(body, encoding))
+    resp.headers["Content-Encoding"] = encoding
+    return resp
@@ -1,31 +1,43 @@
-from flask import Blueprint, send_from_directory
-from ..config import FRONTEND_DIR
+import functools
+from flask import Blueprint
+from ..config import FRONTEND_DIR, STATIC_RELOAD
+from .static_assets import StaticAssets
 
-bp = Blueprint("pages", __name__)
+@functools.lru_cache(maxsize=None)
+def frontend_assets() -> StaticAssets:
+    # Compressing every page at max quality is slow; create_app builds the
+    # store once per process (in the gunicorn master when preload_app is on).
+    return StaticAssets(FRONTEND_DIR, reload=STATIC_RELOAD)
 
-@bp.get("/")
-def index():
-    return send_from_directory(FRONTEND_DIR, "index.html")
+def create_pages_bp(assets: StaticAssets | None = None) -> Blueprint:
+    assets = assets or frontend_assets()
+    bp = Blueprint("pages", __name__)
 
-@bp.get("/login")
-@bp.get("/login.html")
-def login_form():
-    return send_from_directory(FRONTEND_DIR, "login.html")
+    @bp.get("/")
+    def index():
+        return assets.response("index.html")
 
-@bp.get("/signup")
-@bp.get("/Sign_up")
-def signup_form():
-    return send_from_directory(FRONTEND_DIR, "Sign_up.html")
+    @bp.get("/login")
+    @bp.get("/login.html")
+    def login_form():
+        return assets.response("login.html")
 
-@bp.get("/dashboard")
-def dashboard():
-    return send_from_directory(FRONTEND_DIR, "Dashboard.html")
+    @bp.get("/signup")
+    @bp.get("/Sign_up")
+    def signup_form():
+        return assets.response("Sign_up.html")
 
-@bp.get("/Reminder")
-def reminder():
-    return send_from_directory(FRONTEND_DIR, "Reminders.html")
+    @bp.get("/dashboard")
+    def dashboard():
+        return assets.response("Dashboard.html")
 
-@bp.get("/add-plant")
-@bp.get("/Add_plant")
-def add_plant():
-    return send_from_directory(FRONTEND_DIR, "Add_plant.html")
+    @bp.get("/Reminder")
+    def reminder():
+        return assets.response("Reminders.html")
+
+    @bp.get("/add-plant")
+    @bp.get("/Add_plant")
+    def add_plant():
+        return assets.response("Add_plant.html")
+
+    return bp
@@ -2,15 +2,19 @@ import logging
 import os
 import sqlite3
 from pathlib import Path
-from flask import Blueprint, request, jsonify
-from ..Repositories.db import PlantsRepository
-from ..config import PLANT_DB_PATH
+from flask import Blueprint, request, jsonify, url_for
+from ..Repositories.cache import db_version
+from ..Repositories.db import PlantsRepository, resolve_db_path
+from .http_cache import compress_response, make_etag, not_modified
+from ..config import BATCH_MAX_NAMES, PLANT_DB_PATH, SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT
 
-DEFAULT_LIMIT = 25
+DEFAULT_LIMIT = SEARCH_DEFAULT_LIMIT
+MAX_LIMIT = SEARCH_MAX_LIMIT
 
 def create_plants_bp(repo: PlantsRepository | None = None) -> Blueprint:
     repo = repo or PlantsRepository()
     bp = Blueprint("plants", __name__)
+    bp.after_request(compress_response)
 
     @bp.get("/api/debug/plant-path")
     def debug_plant_path():
@@ -20,14 +24,57 @@ def create_plants_bp(repo: PlantsRepository | None = None) -> Blueprint:
     @bp.get("/api/plants/search")
     def search_plants():
         q = request.args.get("q", "").strip()
-        db_path = Path(os.getenv("PLANT_DB_PATH") or PLANT_DB_PATH)
+        fuzzy = request.args.get("fuzzy", "").lower() in ("1", "true", "yes")
+        cursor = request.args.get("cursor") or None
+        try:
+            limit = int(request.args.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        limit = max(1, min(limit, MAX_LIMIT))
+        # The DB the rows come from, which an injected repo may point elsewhere
+        db_path = resolve_db_path(repo.db_path)
         if not q or not db_path.exists():
             return jsonify([])
+        # Same DB contents + same arguments => same body; answer revalidation without querying
+        etag = make_etag(db_version(db_path), sorted(request.args.items(multi=True)), weak=True)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        try:
+            rows, next_cursor = repo.search_page(q, limit=limit, cursor=cursor, fuzzy=fuzzy)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        except sqlite3.Error:
+            logging.exception("Failed to query plants")
+            return jsonify({"error": "database unavailable"}), 500
+        # Body stays a plain array for existing clients; paging rides in headers
+        resp = jsonify(rows)
+        resp.headers["ETag"] = etag
+        resp.headers["Cache-Control"] = "no-cache"
+        if next_cursor:
+            next_url = url_for("plants.search_plants", q=q, limit=limit, cursor=next_cursor)
+            resp.headers["X-Next-Cursor"] = next_cursor
+            resp.headers["Link"] = f'<{next_url}>; rel="next"'
+        return resp
+
+    @bp.post("/api/plants/batch")
+    def batch_plants():
+        payload = request.get_json(silent=True) or {}
+        names = payload.get("names") if isinstance(payload, dict) else None
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            return jsonify({"error": "names must be a list of strings"}), 400
+        names = [n.strip() for n in names if n.strip()]
+        if len(names) > BATCH_MAX_NAMES:
+            return jsonify({"error": f"at most {BATCH_MAX_NAMES} names per request"}), 400
+        db_path = resolve_db_path(repo.db_path)
+        if not names or not db_path.exists():
+            return jsonify({"plants": [], "missing": names})
         try:
-            rows = repo.search(q, limit=DEFAULT_LIMIT)
-            return jsonify(rows)
+            rows = repo.get_many(names)
         except sqlite3.Error:
             logging.exception("Failed to query plants")
             return jsonify({"error": "database unavailable"}), 500
+        found = {r["name"] for r in rows}
+        return jsonify({"plants": rows, "missing": [n for n in dict.fromkeys(names) if n not in found]})
 
     return bp
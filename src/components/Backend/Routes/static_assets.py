@@ -0,0 +1,79 @@
+import hashlib
+import mimetypes
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from flask import Response, abort
+from ..config import STATIC_MAX_AGE
+from .http_cache import brotli, choose_encoding, encode, make_etag, not_modified
+
+@dataclass(frozen=True)
+class Asset:
+    body: bytes
+    etag: str
+    mimetype: str
+    stamp: tuple  # (mtime_ns, size) when loaded, for reload checks
+    variants: dict = field(default_factory=dict)  # encoding -> compressed body
+
+def load_asset(path: Path) -> Asset:
+    body = path.read_bytes()
+    st = os.stat(path)
+    variants = {}
+    for encoding in ("br", "gzip") if brotli is not None else ("gzip",):
+        compressed = encode(body, encoding, best=True)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return Asset(
+        body=body,
+        etag=make_etag(hashlib.sha256(body).hexdigest()),
+        mimetype=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        stamp=(st.st_mtime_ns, st.st_size),
+        variants=variants,
+    )
+
+class StaticAssets:
+    """
+    Files of one directory held in memory with gzip/brotli variants and
+    content-hash ETags computed once at startup. With reload=True each
+    request stats its file and reloads it when it changed (development).
+    """
+    def __init__(self, directory: Path, reload: bool = False, max_age: int = STATIC_MAX_AGE):
+        self.directory = Path(directory)
+        self.reload = reload
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._assets = {
+            p.name: load_asset(p) for p in sorted(self.directory.iterdir()) if p.is_file()
+        } if self.directory.is_dir() else {}
+
+    def get(self, name: str) -> Asset | None:
+        asset = self._assets.get(name)
+        if self.reload:
+            path = self.directory / name
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            if asset is None or asset.stamp != (st.st_mtime_ns, st.st_size):
+                asset = load_asset(path)
+                with self._lock:
+                    self._assets[name] = asset
+        return asset
+
+    def response(self, name: str) -> Response:
+        asset = self.get(name)
+        if asset is None:
+            abort(404)
+        resp = not_modified(asset.etag)
+        if resp is None:
+            encoding = choose_encoding()
+            body = asset.variants.get(encoding)
+            resp = Response(body if body is not None else asset.body, mimetype=asset.mimetype)
+            if body is not None:
+                resp.headers["Content-Encoding"] = encoding
+            resp.headers["ETag"] = asset.etag
+            resp.vary.add("Accept-Encoding")
+        # Revalidate every time while files may change under us
+        resp.headers["Cache-Control"] = "no-cache" if self.reload else f"public, max-age={self.max_age}"
+        return resp
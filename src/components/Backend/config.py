@@ -10,8 +10,16 @@ FRONTEND_DIR = Path(os.getenv("FRONTEND_DIR", Path(__file__).resolve().parents[1
 DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+def _float_list(value: str) -> list[float]:
+    return [float(v) for v in value.split(",") if v.strip()]
+
 PLANT_DB_PATH = Path(os.getenv("PLANT_DB_PATH", DATA_DIR / "Plant.db"))
 
+# Read-only Plant.db connection pool (idle connections kept per worker)
+PLANT_DB_POOL_SIZE = int(os.getenv("PLANT_DB_POOL_SIZE", "4"))
+PLANT_DB_MMAP_SIZE = int(os.getenv("PLANT_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+PLANT_DB_CACHE_KIB = int(os.getenv("PLANT_DB_CACHE_KIB", str(16 * 1024)))
+
 FLASK_ENV = os.getenv("FLASK_ENV", "development")
 
 SECRET_KEY = os.getenv("FLASK_SECRET_KEY")
@@ -21,3 +29,43 @@ if not SECRET_KEY:
     SECRET_KEY = "dev-insecure-key"
 
 PORT = int(os.getenv("PORT", "3000"))
+
+# /api/plants/search page size: default and hard cap for ?limit=
+SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "25"))
+SEARCH_MAX_LIMIT = int(os.getenv("SEARCH_MAX_LIMIT", "100"))
+# Max names accepted by POST /api/plants/batch
+BATCH_MAX_NAMES = int(os.getenv("BATCH_MAX_NAMES", "100"))
+
+# Responses smaller than this are sent uncompressed
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+
+# Plant search result cache (entries=0 disables it)
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+# Postings a fuzzy search reads before it stops collecting candidates;
+# 0 reads them all, returning exact results at a few ms per query on
+# large indexes
+FUZZY_PROBE_POSTINGS = int(os.getenv("FUZZY_PROBE_POSTINGS", "8192"))
+
+# Bounded bcrypt pool for /login and /signup: hashing threads, extra
+# requests allowed to wait for one, and the Retry-After sent when full
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", "2"))
+AUTH_HASH_MAX_PENDING = int(os.getenv("AUTH_HASH_MAX_PENDING", "8"))
+AUTH_HASH_RETRY_AFTER = int(os.getenv("AUTH_HASH_RETRY_AFTER", "1"))
+
+# SQLite queries slower than this are logged (per-query metrics are always on)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+# http_request_duration_seconds buckets (seconds, comma-separated)
+HTTP_LATENCY_BUCKETS = _float_list(os.getenv(
+    "HTTP_LATENCY_BUCKETS", "0.0005,0.001,0.0025,0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5"))
+# Endpoints (e.g. "plants.search_plants") that also get in-process
+# p50/p95/p99 over the last LATENCY_QUANTILE_WINDOW requests; empty = off
+LATENCY_QUANTILE_ENDPOINTS = frozenset(
+    e.strip() for e in os.getenv("LATENCY_QUANTILE_ENDPOINTS", "").split(",") if e.strip())
+LATENCY_QUANTILE_WINDOW = int(os.getenv("LATENCY_QUANTILE_WINDOW", "1024"))
+
+# Frontend pages are served from memory; reload them when the files change
+# (on by default in development) and let browsers cache them this long
+STATIC_RELOAD = os.getenv("STATIC_RELOAD", "1" if FLASK_ENV.lower() == "development" else "0") == "1"
+STATIC_MAX_AGE = int(os.getenv("STATIC_MAX_AGE", "3600"))
@@ -0,0 +1,107 @@
+"""
+Gunicorn settings for the API container:
+
+    gunicorn -c python:src.components.Backend.gunicorn_conf src.components.Backend.wsgi:app
+
+Workers and threads are sized from the CPUs this container may actually
+use (cgroup quota and CPU affinity, not the host's core count).
+GUNICORN_WORKER_CLASS picks "gthread" (default), "gevent" or "sync";
+WEB_CONCURRENCY / GUNICORN_THREADS override the computed sizes.
+
+The app is imported once in the master (preload_app) and shared with the
+workers copy-on-write; each worker then warms its own DB connections and
+caches (App_factory.warm_up) before it accepts requests.
+
+Every worker writes its Prometheus samples to PROMETHEUS_MULTIPROC_DIR and
+/metrics aggregates them, so a scrape sees all workers, not just the one
+that answered.
+"""
+import importlib.util
+import logging
+import math
+import os
+import shutil
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def available_cpus(cgroup_root: Path = CGROUP_ROOT) -> int:
+    """CPUs usable by this process: affinity, capped by a cgroup v2/v1 CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not Linux
+        cpus = os.cpu_count() or 1
+    quota = period = None
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        raw_quota, raw_period = (cgroup_root / "cpu.max").read_text().split()
+        if raw_quota != "max":
+            quota, period = int(raw_quota), int(raw_period)
+    except (OSError, ValueError):
+        try:
+            # cgroup v1: quota is -1 when unlimited
+            quota = int((cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text())
+            period = int((cgroup_root / "cpu" / "cpu.cfs_period_us").read_text())
+        except (OSError, ValueError):
+            pass
+    if quota is not None and period and quota > 0:
+        cpus = min(cpus, math.ceil(quota / period))
+    return max(1, cpus)
+
+
+def pick_worker_class(requested: str) -> str:
+    if requested == "gevent" and importlib.util.find_spec("gevent") is None:
+        logging.getLogger("gunicorn.error").warning("gevent is not installed; using gthread workers")
+        return "gthread"
+    return requested if requested in ("sync", "gthread", "gevent") else "gthread"
+
+
+def size_workers(cpus: int, worker_class: str) -> tuple[int, int]:
+    """(workers, threads per worker) for the given CPU count and worker class."""
+    if worker_class == "sync":
+        # One request per process; extra processes cover requests blocked on I/O
+        return 2 * cpus + 1, 1
+    if worker_class == "gevent":
+        return cpus, 1
+    # gthread: a process per core; threads overlap SQLite/bcrypt waits, both
+    # of which release the GIL
+    return max(2, cpus), 4
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3000')}"
+worker_class = pick_worker_class(os.getenv("GUNICORN_WORKER_CLASS", "gthread"))
+_workers, _threads = size_workers(available_cpus(), worker_class)
+workers = int(os.getenv("WEB_CONCURRENCY", _workers))
+threads = int(os.getenv("GUNICORN_THREADS", _threads))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))  # gevent
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+# Must be in the environment before any worker imports prometheus_client
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server):
+    # Samples from a previous run would be summed into the new one
+    metrics_dir = Path(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+
+
+def post_worker_init(worker):
+    # Runs in the worker after the app is loaded, before it accepts requests
+    from src.components.Backend.App_factory import warm_up
+    warm_up(worker.wsgi)
+    worker.log.info("Worker %s warmed up", worker.pid)
+
+
+def child_exit(server, worker):
+    # Drop the dead worker's live-only series; its counters stay summed in
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,17 +1,31 @@
+import os
 import bcrypt
 import sqlite3 
-from src.data.database import get_connection, init_db
+from src.data.database import get_connection, init_db  # noqa: F401 (init_db: used via AuthService)
+from src.components.Backend.Metrics.prometheus import timed_query
+
+# bcrypt cost factor for new hashes; stored hashes with another cost are
+# rehashed on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
+def hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def hash_rounds(password_hash: str) -> int:
+    # "$2b$12$<salt+hash>"
+    return int(password_hash.split("$")[2])
 
-init_db()  
 
 def create_user(username: str, email: str, password: str) -> None:
-    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    password_hash = hash_password(password)
     try:
-        with get_connection() as conn:
-            conn.execute(
+        with get_connection() as conn, timed_query("accounts", "insert_user") as q:
+            q.rows = conn.execute(
                 "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
                 (username, email, password_hash),
-            )
+            ).rowcount
             conn.commit()
     except sqlite3.IntegrityError as err:
         raise ValueError("Username or email already exists") from err
@@ -19,13 +33,24 @@ def create_user(username: str, email: str, password: str) -> None:
     
 
 def authenticate_user(email: str, password: str) -> bool:
-    with get_connection() as conn:
+    with get_connection() as conn, timed_query("accounts", "password_hash") as q:
         row = conn.execute(
             "SELECT password_hash FROM users WHERE email = ?",
             (email.lower(),),
         ).fetchone()
+        q.rows = int(row is not None)
     if row is None:
         return False
-    return bcrypt.checkpw(password.encode("utf-8"), row[0].encode("utf-8"))
+    if not bcrypt.checkpw(password.encode("utf-8"), row[0].encode("utf-8")):
+        return False
+    if hash_rounds(row[0]) != BCRYPT_ROUNDS:
+        # Only replace the hash that was checked, in case of a concurrent change
+        new_hash = hash_password(password)
+        with get_connection() as conn, timed_query("accounts", "rehash_password") as q:
+            q.rows = conn.execute(
+                "UPDATE users SET password_hash = ? WHERE email = ? AND password_hash = ?",
+                (new_hash, email.lower(), row[0]),
+            ).rowcount
+    return True
 
     
@@ -0,0 +1,264 @@
+"""
+ETL-side persistence of the cleaned plant index into Plant.db. Kept apart
+from src.data.database so the web app never imports pandas/numpy.
+"""
+import logging
+import sqlite3
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+PLANTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+name TEXT PRIMARY KEY,
+water_frequency INTEGER,
+sunlight_hours REAL,
+soil_type TEXT,
+content_hash INTEGER
+);
+"""
+
+# Bulk-load staging table: no constraints, so rows append without index
+# maintenance; the UNIQUE name index is built once after the load
+PLANTS_LOAD_SQL = """
+CREATE TABLE plants_load (
+name TEXT,
+water_frequency INTEGER,
+sunlight_hours REAL,
+soil_type TEXT,
+content_hash INTEGER
+);
+"""
+
+PLANTS_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS plants_fts USING fts5(name, content='plants', content_rowid='rowid');
+"""
+
+PLANTS_FTS_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS plants_ai AFTER INSERT ON plants BEGIN
+INSERT INTO plants_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS plants_ad AFTER DELETE ON plants BEGIN
+INSERT INTO plants_fts(plants_fts, rowid, name) VALUES('delete', old.rowid, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS plants_au AFTER UPDATE ON plants BEGIN
+INSERT INTO plants_fts(plants_fts, rowid, name) VALUES('delete', old.rowid, old.name);
+INSERT INTO plants_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+"""
+
+
+def plant_rows(plants: pd.DataFrame):
+    """
+    (name, water_frequency, sunlight_hours, soil_type, content_hash) tuples
+    built column-wise: each column is converted once to Python ints/floats/
+    strs with None for missing values, then zipped, instead of boxing every
+    row via iterrows(). Non-numeric text in the numeric columns is stored as
+    NULL. content_hash is a 64-bit hash of the three value columns, used by
+    delta syncs to skip unchanged rows.
+    """
+    names = plants["name"].astype(str).tolist()
+
+    water = pd.to_numeric(plants["water_frequency"], errors="coerce")
+    water = np.trunc(water.astype(float)).astype("Int64")
+    water_values = water.to_numpy(dtype=object, na_value=None)
+
+    sun = pd.to_numeric(plants["sunlight_hours"], errors="coerce").astype(float)
+    sun_values = sun.to_numpy(dtype=object)
+    sun_values[sun.isna().to_numpy()] = None
+
+    soil = plants["soil_type"]
+    soil_values = soil.astype(object).astype(str).to_numpy(dtype=object)
+    soil_values[soil.isna().to_numpy()] = None
+
+    hashes = pd.util.hash_pandas_object(
+        pd.DataFrame({
+            "water_frequency": water.to_numpy(dtype=float, na_value=np.nan),
+            "sunlight_hours": sun.to_numpy(),
+            "soil_type": pd.Series(soil_values, dtype=object).fillna("\0"),
+        }),
+        index=False,
+    ).to_numpy().view(np.int64).tolist()
+
+    return zip(names, water_values, sun_values, soil_values, hashes)
+
+
+def _ensure_hash_column(con: sqlite3.Connection) -> None:
+    # Plant.db files from before content hashes were stored
+    cols = {row[1] for row in con.execute("PRAGMA table_info(plants)")}
+    if cols and "content_hash" not in cols:
+        con.execute("ALTER TABLE plants ADD COLUMN content_hash INTEGER")
+
+
+def persist_sqlite(plants: pd.DataFrame, db_path: Path, mode: str = "upsert") -> Path:
+    """
+    Write the plant index to SQLite.
+
+    mode="upsert" (default) merges rows into the existing table, with FTS
+    triggers keeping plants_fts in sync row by row.
+    mode="bulk" replaces the table: names are de-duplicated in pandas, rows
+    are appended to a fresh table with no constraints, indexes or triggers
+    inside a single transaction, which is then swapped in, and the UNIQUE
+    name index and plants_fts are built once over the result.
+    Readers see either the old or the new table, never a partial load.
+    mode="delta" syncs the table to the index in one transaction: new names
+    are inserted, rows whose content hash differs are updated, names missing
+    from the index are deleted, and unchanged rows are not written at all,
+    so FTS triggers only fire for rows that actually changed.
+    """
+    if mode not in ("upsert", "bulk", "delta"):
+        raise ValueError(f"unknown persist mode: {mode}")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(db_path)
+
+    try:
+        if mode == "bulk":
+            _bulk_load(con, plants)
+        elif mode == "delta":
+            _delta_sync(con, plants)
+        else:
+            _upsert(con, plants)
+    finally:
+        con.close()
+
+    return db_path
+
+
+def _upsert(con: sqlite3.Connection, plants: pd.DataFrame) -> None:
+    cur = con.cursor()
+
+    cur.executescript("PRAGMA journal_mode=WAL;" + PLANTS_TABLE_SQL.format(table="plants"))
+    _ensure_hash_column(con)
+
+    cur.executemany("""
+    INSERT INTO plants(name, water_frequency, sunlight_hours, soil_type, content_hash)
+    VALUES(?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+    water_frequency=excluded.water_frequency,
+    sunlight_hours=excluded.sunlight_hours,
+    soil_type=excluded.soil_type,
+    content_hash=excluded.content_hash
+    """, plant_rows(plants))
+
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_plants_name ON plants(name);")
+    _ensure_fts(cur)
+    con.commit()
+
+
+def _ensure_fts(cur: sqlite3.Cursor) -> None:
+    try:
+        # An existing plants_fts is kept in sync by its triggers. A new one
+        # is filled with 'rebuild': selecting rowids from an external-content
+        # FTS table reads the content table, so a "NOT IN plants_fts"
+        # backfill would never insert anything.
+        created = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'plants_fts'"
+        ).fetchone() is None
+        # Statement by statement: executescript() would commit an open
+        # transaction (the delta sync runs inside one)
+        cur.execute(PLANTS_FTS_SQL)
+        for stmt in PLANTS_FTS_TRIGGERS_SQL.split("END;")[:-1]:
+            cur.execute(stmt + "END;")
+        if created:
+            cur.execute("INSERT INTO plants_fts(plants_fts) VALUES('rebuild')")
+    except sqlite3.OperationalError:
+        pass
+
+
+def _bulk_load(con: sqlite3.Connection, plants: pd.DataFrame) -> None:
+    con.executescript("""
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-262144;
+    """)
+    con.isolation_level = None  # explicit transaction control below
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("DROP TABLE IF EXISTS plants_load")
+        con.execute(PLANTS_LOAD_SQL)
+        # Duplicate names keep the last row, as the upsert path does
+        plants = plants.assign(name=plants["name"].astype(str)).drop_duplicates("name", keep="last")
+        con.executemany(
+            "INSERT INTO plants_load(name, water_frequency, sunlight_hours, soil_type, content_hash) "
+            "VALUES(?, ?, ?, ?, ?)",
+            plant_rows(plants),
+        )
+        con.execute("DROP TABLE IF EXISTS plants")  # also drops its indexes and triggers
+        con.execute("ALTER TABLE plants_load RENAME TO plants")
+        # Also the conflict target for later upsert/delta runs
+        con.execute("CREATE UNIQUE INDEX idx_plants_name ON plants(name)")
+        try:
+            con.execute("DROP TABLE IF EXISTS plants_fts")
+            con.execute(PLANTS_FTS_SQL)
+            con.execute("INSERT INTO plants_fts(plants_fts) VALUES('rebuild')")
+            for stmt in PLANTS_FTS_TRIGGERS_SQL.split("END;")[:-1]:
+                con.execute(stmt + "END;")
+        except sqlite3.OperationalError:
+            pass  # SQLite built without FTS5; search falls back to LIKE
+        con.execute("COMMIT")
+    except BaseException:
+        if con.in_transaction:
+            con.execute("ROLLBACK")
+        raise
+
+
+def _delta_sync(con: sqlite3.Connection, plants: pd.DataFrame) -> dict:
+    con.executescript("PRAGMA journal_mode=WAL;" + PLANTS_TABLE_SQL.format(table="plants"))
+    _ensure_hash_column(con)
+    con.isolation_level = None  # explicit transaction control below
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("DROP TABLE IF EXISTS temp.plants_incoming")
+        con.execute(PLANTS_TABLE_SQL.format(table="temp.plants_incoming"))
+        # Duplicate names keep the last row, as the upsert path does
+        con.executemany(
+            "INSERT OR REPLACE INTO temp.plants_incoming(name, water_frequency, sunlight_hours, soil_type, content_hash) "
+            "VALUES(?, ?, ?, ?, ?)",
+            plant_rows(plants),
+        )
+        inserted, updated, deleted = con.execute("""
+        SELECT
+        (SELECT count(*) FROM temp.plants_incoming i
+         WHERE NOT EXISTS (SELECT 1 FROM main.plants p WHERE p.name = i.name)),
+        (SELECT count(*) FROM temp.plants_incoming i JOIN main.plants p ON p.name = i.name
+         WHERE p.content_hash IS NOT i.content_hash),
+        (SELECT count(*) FROM main.plants p
+         WHERE NOT EXISTS (SELECT 1 FROM temp.plants_incoming i WHERE i.name = p.name))
+        """).fetchone()
+
+        # "WHERE true" disambiguates the upsert clause from a join constraint
+        con.execute("""
+        INSERT INTO main.plants(name, water_frequency, sunlight_hours, soil_type, content_hash)
+        SELECT name, water_frequency, sunlight_hours, soil_type, content_hash
+        FROM temp.plants_incoming WHERE true
+        ON CONFLICT(name) DO UPDATE SET
+        water_frequency=excluded.water_frequency,
+        sunlight_hours=excluded.sunlight_hours,
+        soil_type=excluded.soil_type,
+        content_hash=excluded.content_hash
+        WHERE plants.content_hash IS NOT excluded.content_hash
+        """)
+        con.execute("""
+        DELETE FROM main.plants
+        WHERE NOT EXISTS (SELECT 1 FROM temp.plants_incoming i WHERE i.name = plants.name)
+        """)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_plants_name ON plants(name)")
+        _ensure_fts(con.cursor())
+        con.execute("DROP TABLE temp.plants_incoming")
+        con.execute("COMMIT")
+    except BaseException:
+        if con.in_transaction:
+            con.execute("ROLLBACK")
+        raise
+
+    counts = {"inserted": inserted, "updated": updated, "deleted": deleted,
+              "unchanged": con.execute("SELECT count(*) FROM plants").fetchone()[0] - inserted - updated}
+    logger.info("Delta sync: %(inserted)d inserted, %(updated)d updated, "
+                "%(deleted)d deleted, %(unchanged)d unchanged", counts)
+    return counts
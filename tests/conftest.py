@@ -1,6 +1,7 @@
 import os
 import sys
 import sqlite3
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,7 +10,18 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# Apps built at import time or in subprocesses must not write src/data/Accounts.db
+os.environ["ACCOUNTS_DB_PATH"] = str(Path(tempfile.mkdtemp(prefix="accounts-")) / "Accounts.db")
+
 from src.components.Backend.App_factory import create_app   
+import src.data.database as accounts_database
+
+@pytest.fixture(autouse=True)
+def accounts_db(tmp_path, monkeypatch) -> Path:
+    db_path = tmp_path / "Accounts.db"
+    monkeypatch.setenv("ACCOUNTS_DB_PATH", str(db_path))
+    monkeypatch.setattr(accounts_database, "db_path", db_path)
+    return db_path
 
 @pytest.fixture()
 def plants_db(tmp_path, monkeypatch) -> Path:
@@ -1,3 +1,5 @@
+import json
+
 def test_debug_plant_path(client):
     r = client.get("/api/debug/plant-path")
     assert r.status_code == 200
@@ -18,3 +20,57 @@ def test_page_routes_serve(client):
     assert client.get("/login.html").status_code in (200, 304)
     assert client.get("/dashboard").status_code in (200, 304)
     assert client.get("/Reminder").status_code in (200, 304)
+
+def test_batch_plants_lookup(client):
+    r = client.post("/api/plants/batch", json={"names": ["Pothos", "Unknown", "Pothos"]})
+    assert r.status_code == 200
+    assert [p["name"] for p in r.get_json()["plants"]] == ["Pothos"]
+    assert r.get_json()["missing"] == ["Unknown"]
+
+def test_batch_plants_validates_input(client):
+    assert client.post("/api/plants/batch", json={"names": "Pothos"}).status_code == 400
+    assert client.post("/api/plants/batch", json={"names": ["x"] * 1000}).status_code == 400
+
+def test_search_conditional_get(client):
+    r = client.get("/api/plants/search?q=Poth")
+    etag = r.headers["ETag"]
+    r2 = client.get("/api/plants/search?q=Poth", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.data == b""
+
+def test_search_etag_follows_the_injected_repo_db(plants_db, tmp_path):
+    import shutil
+    import sqlite3
+    from src.components.Backend.App_factory import create_app
+    from src.components.Backend.Repositories.db import PlantsRepository
+
+    own_db = tmp_path / "own" / "Plant.db"
+    own_db.parent.mkdir()
+    shutil.copy(plants_db, own_db)
+    repo = PlantsRepository(db_path=own_db)
+    client = create_app({"TESTING": True}, services={"plants_repo": repo}).test_client()
+    etag = client.get("/api/plants/search?q=Poth").headers["ETag"]
+
+    con = sqlite3.connect(own_db)
+    con.execute("INSERT INTO plants(name) VALUES ('Pothos Neon')")
+    con.commit()
+    con.close()
+    r = client.get("/api/plants/search?q=Poth", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert [row["name"] for row in r.get_json()] == ["Pothos", "Pothos Neon"]
+
+def test_search_compression_threshold(client, plants_db):
+    import gzip
+    import sqlite3
+
+    r = client.get("/api/plants/search?q=Poth", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in r.headers
+
+    con = sqlite3.connect(plants_db)
+    con.executemany("INSERT INTO plants(name, soil_type) VALUES (?, ?)",
+                    [(f"Pothos {i}", "Aroid mix " * 10) for i in range(50)])
+    con.commit()
+    con.close()
+    r = client.get("/api/plants/search?q=Poth&limit=50", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(r.data))) == 50
@@ -25,3 +25,50 @@ def test_login_bad(client, monkeypatch):
     monkeypatch.setattr(auth, "authenticate_user", lambda e,p: False)
     r = client.post("/login", data={"email":"e@e.com","password":"abcdefgh"})
     assert r.status_code == 401
+
+def test_login_returns_503_when_hashing_pool_is_full(plants_db):
+    import threading
+    from src.components.Backend.App_factory import create_app
+    from src.components.Backend.Routes.auth import AuthService, HashingExecutor
+
+    release = threading.Event()
+    started = threading.Event()
+
+    class SlowImpl:
+        def init_db(self):
+            pass
+
+        def authenticate_user(self, email, password):
+            started.set()
+            release.wait(5)
+            return True
+
+    service = AuthService(SlowImpl(), HashingExecutor(workers=1, max_pending=0, retry_after=3))
+    app = create_app({"TESTING": True}, services={"auth_service": service})
+    holder = threading.Thread(target=app.test_client().post, args=("/login",), kwargs={"data": {"email": "a@a.com", "password": "x"}})
+    holder.start()
+    started.wait(5)
+    try:
+        r = app.test_client().post("/login", data={"email": "e@e.com", "password": "abcdefgh"})
+        assert r.status_code == 503
+        assert r.headers["Retry-After"] == "3"
+    finally:
+        release.set()
+        holder.join()
+
+def test_login_rehashes_when_cost_changes(tmp_path, monkeypatch):
+    import src.data.database as database
+    import src.data.Auth as auth
+    monkeypatch.setattr(database, "db_path", tmp_path / "Accounts.db")
+    auth.init_db()
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 4)
+    auth.create_user("u", "e@e.com", "abcdefgh")
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 5)
+
+    assert not auth.authenticate_user("e@e.com", "wrong-pass")
+    with database.get_connection() as conn:
+        assert auth.hash_rounds(conn.execute("SELECT password_hash FROM users").fetchone()[0]) == 4
+    assert auth.authenticate_user("e@e.com", "abcdefgh")
+    with database.get_connection() as conn:
+        assert auth.hash_rounds(conn.execute("SELECT password_hash FROM users").fetchone()[0]) == 5
+    assert auth.authenticate_user("e@e.com", "abcdefgh")
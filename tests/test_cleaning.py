@@ -0,0 +1,257 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+import Cleaning
+
+
+def _coerce_numeric_reference(series: pd.Series) -> pd.Series:
+    """Original per-cell implementation, kept as the equivalence oracle."""
+    def parse(value):
+        if pd.isna(value):
+            return pd.NA
+        text = str(value).strip()
+        if text == "":
+            return pd.NA
+        match = Cleaning.RANGE_RE.match(text)
+        if match:
+            lo, hi = map(float, match.groups())
+            return (lo + hi) / 2
+        if re.fullmatch(r"-?\d+(?:\.\d+)?", text):
+            return float(text)
+        return text
+    return series.map(parse)
+
+
+MIXED = ["1", "2.5", " 3 ", "1-3", "1 – 2.5", "-4", "abc", " x ", "", None, np.nan,
+         "nan", "1e5", "1.", "-", "2020-01-01", 5, 2.0, True, "True"]
+
+
+@pytest.mark.parametrize("values", [
+    MIXED,
+    ["1", "2", " 7.5 "],
+    ["1", None],
+    ["Loam", None, ""],
+    [None, None],
+    [],
+    list(np.random.default_rng(0).choice(np.array(MIXED, dtype=object), 500)),
+])
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_coerce_numeric_matches_reference(values, dtype):
+    if dtype == "string":
+        values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+    series = pd.Series(values, dtype=dtype, name="col", index=range(10, 10 + len(values)))
+    assert_series_equal(Cleaning._coerce_numeric(series), _coerce_numeric_reference(series))
+
+
+def _pick_name_reference(row, candidates):
+    for c in candidates:
+        v = row.get(c)
+        if pd.notna(v) and str(v).strip():
+            return str(v).strip()
+    return ""
+
+
+def test_build_plant_index_name_resolution_matches_reference():
+    df = pd.DataFrame({
+        "name": [None, "  ", "Basil", np.nan, None, "Basil"],
+        "species": ["Ocimum", None, "Ocimum", "  Mentha ", None, None],
+        "crop": ["Herb", "Corn", None, "Mint", None, None],
+        "plant_health_status": [None, None, None, None, 3.5, None],
+        "water_frequency": [1, 2, 3, 4, 5, 6],
+    })
+    candidates = ["name", "species", "crop", "plant_health_status"]
+    expected = df.apply(lambda row: _pick_name_reference(row, candidates), axis=1)
+    assert Cleaning.pick_names(df, candidates).tolist() == expected.tolist()
+
+    idx = Cleaning.build_plant_index(df)
+    assert idx["name"].tolist() == ["Ocimum", "Corn", "Basil", "Mentha", "3.5"]
+    assert idx["water_frequency"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_clean_datasets_parallel_keeps_order(tmp_path):
+    config = {}
+    paths = {}
+    for name in ["zeta", "alpha", "mid"]:
+        base = tmp_path / name
+        base.mkdir()
+        (base / f"{name}.csv").write_text("Plant Name,Water\nBasil, 1-3\nMint,2\n")
+        config[name] = {"preferred_files": [f"{name}.csv"]}
+        paths[name] = base
+
+    sequential = Cleaning.clean_datasets(paths, config, jobs=1)
+    parallel = Cleaning.clean_datasets(paths, config, jobs=3)
+    assert list(parallel) == ["zeta", "alpha", "mid"]
+    for name in paths:
+        pd.testing.assert_frame_equal(parallel[name], sequential[name])
+
+
+def test_load_clean_dataset_uses_content_addressed_cache(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    base = tmp_path / "src"
+    base.mkdir()
+    csv = base / "plants.csv"
+    csv.write_text("Plant Name,Water\nBasil,3\nMint,2\n")
+    cache_dir = tmp_path / "cache"
+    info = {"preferred_files": ["plants.csv"]}
+
+    fresh = Cleaning.load_clean_dataset("herbs", base, info, cache_dir)
+    assert len(list(cache_dir.glob("herbs-*.parquet"))) == 1
+
+    def boom(*_):
+        raise AssertionError("cache miss")
+    monkeypatch.setattr(Cleaning, "standardize_columns", boom)
+    pd.testing.assert_frame_equal(Cleaning.load_clean_dataset("herbs", base, info, cache_dir), fresh)
+
+    with pytest.raises(AssertionError, match="cache miss"):
+        Cleaning.load_clean_dataset("herbs", base, info, cache_dir, chunksize=1)
+
+    csv.write_text("Plant Name,Water\nBasil,4\n")
+    with pytest.raises(AssertionError, match="cache miss"):
+        Cleaning.load_clean_dataset("herbs", base, info, cache_dir)
+
+
+def test_chunked_load_matches_whole_file(tmp_path):
+    rows = ["Plant Name,Water Need,Height,Soil"]
+    for i in range(60):
+        water = "" if i % 7 == 0 else (f"{i % 5}-{i % 5 + 2}" if i % 3 == 0 else str(i % 9))
+        height = "" if i % 11 == 0 else f"{i * 1.5}"
+        rows.append(f" Plant {i % 25} ,{water},{height},Loam")
+    rows += rows[1:12]  # duplicates that land in later chunks
+    base = tmp_path / "src"
+    base.mkdir()
+    (base / "plants.csv").write_text("\n".join(rows) + "\n")
+    info = {"preferred_files": ["plants.csv"]}
+
+    whole = Cleaning.load_clean_dataset("p", base, info)
+    chunked = Cleaning.load_clean_dataset("p", base, info, chunksize=8)
+    assert len(whole) == 60
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+@pytest.mark.parametrize("csv, rows", [
+    # "1-3" and "2" both coerce to 2.0, but only identical text is a duplicate
+    ("Plant,Water\nBasil,1-3\nMint,x\nBasil,2\nMint,y\n", 4),
+    # Water is numeric in the first chunk and mixed in the second
+    ("Plant,Water\nBasil,1\nSage,2\nMint,x\nBasil,1\n", 3),
+])
+def test_chunked_load_dedupes_like_whole_file(tmp_path, csv, rows):
+    (tmp_path / "plants.csv").write_text(csv)
+    info = {"preferred_files": ["plants.csv"]}
+
+    whole = Cleaning.load_clean_dataset("p", tmp_path, info)
+    chunked = Cleaning.load_clean_dataset("p", tmp_path, info, chunksize=2)
+    assert len(whole) == rows
+    pd.testing.assert_frame_equal(chunked, whole)
+    # assert_frame_equal treats 1 == 1.0 in object columns; the types must match too
+    assert [type(v) for v in chunked["water"]] == [type(v) for v in whole["water"]]
+
+
+def test_compact_dtypes_shrinks_and_keeps_nulls():
+    df = pd.DataFrame({
+        "soil": ["Loam", "Clay", None, "Loam"] * 25,
+        "notes": [f"note {i}" for i in range(99)] + [None],
+        "count": np.arange(100, dtype=np.int64),
+        "half": np.arange(100) / 2,
+        "third": np.arange(100) / 3,
+        "mixed": [1.0, "x"] * 50,
+    })
+    out = Cleaning.compact_dtypes(df, "t")
+    assert out["soil"].dtype == "category"
+    assert out["count"].dtype == np.int8
+    assert out["half"].dtype == np.float32
+    assert out["third"].dtype == np.float64
+    assert out["mixed"].dtype == object
+    assert out.isna().equals(df.isna())
+    assert out.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+
+
+def test_concat_compacted_matches_compacting_the_whole_frame():
+    df = pd.DataFrame({
+        # category in the first chunks, too many distinct values overall
+        "notes": ["a", "a", "b", "b"] * 5 + [f"note {i}" for i in range(20)],
+        "soil": ["Loam", "Clay", None, "Loam"] * 10,
+        "empty": [None] * 20 + ["x", "y"] * 10,
+        "count": np.r_[np.arange(20), np.arange(20) * 1000],
+        "half": np.r_[np.arange(20) / 2, np.arange(20) / 3],
+        "mixed": ["x"] * 20 + [1.0, "y"] * 10,
+    })
+    chunks = (df.iloc[i:i + 10].reset_index(drop=True) for i in range(0, len(df), 10))
+    out = Cleaning.concat_compacted(chunks, "t")
+    pd.testing.assert_frame_equal(out, Cleaning.compact_dtypes(df, "t"))
+    assert out["notes"].dtype != "category"
+    assert out["soil"].dtype == "category"
+
+
+def test_standardize_columns_keeps_real_nulls():
+    df = pd.DataFrame({"Soil Type": pd.Series([" Loam ", None, np.nan], dtype=object)})
+    out = Cleaning.standardize_columns(df)
+    assert out["soil_type"].tolist()[0] == "Loam"
+    assert out["soil_type"].isna().sum() == 1
+
+
+def _merge_reference(frames):
+    items = list(frames.items())
+    unified = items[0][1]
+    for name, df in items[1:]:
+        keys = Cleaning.find_merge_keys(unified.columns, df.columns)
+        if keys:
+            unified = unified.merge(df, on=list(keys), how="outer", suffixes=("", f"_{name}"))
+        else:
+            unified = pd.concat([unified, df], ignore_index=True, sort=False)
+    return unified.reset_index(drop=True)
+
+
+def test_merge_dataframes_indexed_join_matches_chained_merges():
+    frames = {
+        "base": pd.DataFrame({"plant_id": [3, 1, 2], "date": ["d3", "d1", "d2"], "height": [3.0, 1.0, 2.0]}),
+        "water": pd.DataFrame({"plant_id": [1, 4], "date": ["d1", "d4"], "water": [10.0, 40.0], "height": [1.5, 4.5]}),
+        "soil": pd.DataFrame({"plant_id": [2, 3], "date": ["d2", "d3"], "soil": ["Loam", "Clay"]}),
+        "other": pd.DataFrame({"crop": ["Corn"], "yield": [1.0]}),
+    }
+    expected = _merge_reference(frames)
+    result = Cleaning.merge_dataframes(frames)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_merge_dataframes_guards_row_explosion():
+    frames = {
+        "base": pd.DataFrame({"plant": ["a"] * 50, "x": range(50)}),
+        "many": pd.DataFrame({"plant": ["a"] * 50, "y": range(50)}),
+    }
+    stats = Cleaning.key_cardinality(frames["base"], frames["many"], ("plant",))
+    assert stats["output_rows"] == 2500
+    result = Cleaning.merge_dataframes(frames, max_expansion=10)
+    assert len(result) == 100
+
+
+def test_merge_dataframes_replans_keys_after_rejected_join():
+    # "date" only reaches the joined table through "many", which is rejected
+    frames = {
+        "base": pd.DataFrame({"plant": ["a"] * 50, "x": range(50)}),
+        "many": pd.DataFrame({"plant": ["a"] * 50, "date": ["d"] * 50, "y": range(50)}),
+        "later": pd.DataFrame({"plant": ["a"], "date": ["d"], "z": [1.0]}),
+    }
+    result = Cleaning.merge_dataframes(frames, max_expansion=10)
+    assert len(result) == 100
+    assert result["z"].notna().sum() == 50
+    assert result["y"].notna().sum() == 50
+
+
+def test_coerce_types_parses_str_dtype_columns():
+    df = pd.DataFrame({"temperature": pd.Series(["10-20", "30", None], dtype="string[python]")})
+    out = Cleaning.coerce_types(df)
+    assert out["temperature"].tolist()[:2] == [15.0, 30.0]
+    assert pd.isna(out["temperature"].iloc[2])
+
+
+def test_local_datasets_maps_each_dataset_dir(tmp_path):
+    config = {"a": {"preferred_files": ["a.csv"]}, "b": {"preferred_files": ["b.csv"]}}
+    (tmp_path / "a").mkdir()
+    with pytest.raises(FileNotFoundError, match="b"):
+        Cleaning.local_datasets(config, tmp_path)
+    (tmp_path / "b").mkdir()
+    assert Cleaning.local_datasets(config, tmp_path) == {"a": tmp_path / "a", "b": tmp_path / "b"}
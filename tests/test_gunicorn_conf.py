@@ -0,0 +1,49 @@
+import importlib
+
+import pytest
+
+
+@pytest.fixture()
+def conf(tmp_path, monkeypatch):
+    # Importing the config sets PROMETHEUS_MULTIPROC_DIR if unset; keep that
+    # out of the rest of the test session
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path / "prom"))
+    return importlib.import_module("src.components.Backend.gunicorn_conf")
+
+
+def test_available_cpus_honours_cgroup_quota(conf, tmp_path, monkeypatch):
+    monkeypatch.setattr(conf.os, "sched_getaffinity", lambda _: set(range(8)))
+    v2 = tmp_path / "v2"
+    v2.mkdir()
+    (v2 / "cpu.max").write_text("150000 100000\n")
+    assert conf.available_cpus(v2) == 2
+    (v2 / "cpu.max").write_text("max 100000\n")
+    assert conf.available_cpus(v2) == 8
+
+    v1 = tmp_path / "v1"
+    (v1 / "cpu").mkdir(parents=True)
+    (v1 / "cpu" / "cpu.cfs_quota_us").write_text("300000")
+    (v1 / "cpu" / "cpu.cfs_period_us").write_text("100000")
+    assert conf.available_cpus(v1) == 3
+    (v1 / "cpu" / "cpu.cfs_quota_us").write_text("-1")
+    assert conf.available_cpus(v1) == 8
+    assert conf.available_cpus(tmp_path / "missing") == 8
+
+
+def test_worker_sizing_by_class(conf):
+    assert conf.size_workers(1, "gthread") == (2, 4)
+    assert conf.size_workers(4, "gthread") == (4, 4)
+    assert conf.size_workers(2, "sync") == (5, 1)
+    assert conf.size_workers(4, "gevent") == (4, 1)
+    assert conf.pick_worker_class("bogus") == "gthread"
+
+
+def test_warm_up_opens_db_and_builds_caches(app):
+    from src.components.Backend.App_factory import warm_up
+    from src.components.Backend.Repositories.db import get_pool
+
+    warm_up(app)
+    repo = app.extensions["plants_repo"]
+    assert repo._trigram is not None
+    assert get_pool()._idle  # connection handed back to the pool, ready for reuse
+    assert app.extensions["auth_service"]._impl is not None
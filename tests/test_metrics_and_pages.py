@@ -13,3 +13,104 @@ def test_metrics(client):
 def test_all_pages(client):
     for path in ["/", "/login.html", "/signup", "/dashboard", "/add-plant"]:
         assert client.get(path).status_code in (200, 304)
+
+def test_metrics_aggregate_across_worker_processes(tmp_path):
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    # Each process stands in for a gunicorn worker sharing the metrics dir
+    worker = """
+import sys
+from src.components.Backend.App_factory import create_app
+client = create_app({"TESTING": True}).test_client()
+for _ in range(int(sys.argv[1])):
+    client.get("/health")
+if len(sys.argv) > 2:
+    sys.stdout.write(client.get("/metrics").get_data(as_text=True))
+"""
+    metrics_dir = tmp_path / "prom"
+    metrics_dir.mkdir()
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(metrics_dir), PLANT_DB_PATH=str(tmp_path / "Plant.db"))
+    root = Path(__file__).resolve().parents[1]
+    run = lambda *args: subprocess.run([sys.executable, "-c", worker, *args], cwd=root, env=env,
+                                       capture_output=True, text=True, check=True).stdout
+    run("3")
+    run("2")
+    scrape = run("1", "scrape")
+
+    line = next(l for l in scrape.splitlines()
+                if l.startswith("http_requests_total{") and 'endpoint="health.health"' in l)
+    assert float(line.rsplit(" ", 1)[1]) == 6.0
+
+def test_unmatched_paths_share_one_label(client):
+    for i in range(3):
+        assert client.get(f"/wp-admin/probe-{i}.php").status_code == 404
+    scrape = client.get("/metrics").get_data(as_text=True)
+    assert "probe-" not in scrape
+    assert 'endpoint="unmatched"' in scrape
+
+def test_latency_quantiles_for_selected_endpoints(client, monkeypatch):
+    from src.components.Backend.Metrics import prometheus as prom
+    quantiles = prom.LatencyQuantiles(endpoints={"health.health"}, window=100)
+    monkeypatch.setattr(prom, "latency_quantiles", quantiles)
+    for _ in range(5):
+        client.get("/health")
+    client.get("/")
+    snap = quantiles.snapshot()
+    assert list(snap) == ["health.health"]
+    assert set(snap["health.health"]) == {0.5, 0.95, 0.99}
+    assert snap["health.health"][0.5] <= snap["health.health"][0.99]
+
+    for seconds in range(1, 101):
+        quantiles.observe("health.health", seconds / 1000)
+    assert quantiles.snapshot()["health.health"] == {0.5: 0.051, 0.95: 0.096, 0.99: 0.1}
+    sample = next(quantiles.collect()).samples[0]
+    assert sample.labels == {"endpoint": "health.health", "quantile": "0.5"}
+
+def test_pages_served_precompressed_with_etag(client):
+    import gzip
+    r = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert b"<html" in gzip.decompress(r.data).lower()
+    assert r.headers["Content-Type"].startswith("text/html")
+
+    r2 = client.get("/", headers={"If-None-Match": r.headers["ETag"]})
+    assert r2.status_code == 304
+    assert r2.data == b""
+
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == r.headers["ETag"]
+
+def test_static_assets_reload_changed_files(tmp_path):
+    import os
+    from flask import Flask
+    from src.components.Backend.Routes.static_assets import StaticAssets
+
+    page = tmp_path / "page.html"
+    page.write_text("<p>one</p>")
+    fixed = StaticAssets(tmp_path)
+    live = StaticAssets(tmp_path, reload=True)
+    etag = live.get("page.html").etag
+
+    page.write_text("<p>two, longer</p>")
+    os.utime(page, ns=(1, 1))
+    assert fixed.get("page.html").body == b"<p>one</p>"
+    assert live.get("page.html").body == b"<p>two, longer</p>"
+    assert live.get("page.html").etag != etag
+
+    with Flask(__name__).test_request_context():
+        assert live.response("page.html").headers["Cache-Control"] == "no-cache"
+        assert fixed.response("page.html").headers["Cache-Control"].startswith("public, max-age=")
+
+def test_pages_use_the_asset_store_given_to_create_app(tmp_path):
+    from src.components.Backend.App_factory import create_app
+    from src.components.Backend.Routes.static_assets import StaticAssets
+
+    (tmp_path / "index.html").write_text("<p>injected</p>")
+    app = create_app({"TESTING": True}, services={"static_assets": StaticAssets(tmp_path)})
+    r = app.test_client().get("/", headers={"Accept-Encoding": "identity"})
+    assert r.data == b"<p>injected</p>"
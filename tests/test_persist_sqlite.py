@@ -0,0 +1,103 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.plant_index import persist_sqlite
+
+
+def _index(names, water=None):
+    n = len(names)
+    return pd.DataFrame({
+        "name": names,
+        "water_frequency": water if water is not None else [np.nan] * n,
+        "sunlight_hours": np.linspace(1, 8, n),
+        "soil_type": pd.Series(["Loam", None] * n, dtype=object)[:n],
+    })
+
+
+def _rows(db_path):
+    con = sqlite3.connect(db_path)
+    try:
+        return con.execute("SELECT name, water_frequency, soil_type FROM plants ORDER BY name").fetchall()
+    finally:
+        con.close()
+
+
+@pytest.mark.parametrize("mode", ["upsert", "bulk"])
+def test_persist_sqlite_modes_write_same_rows(tmp_path, mode):
+    db_path = tmp_path / "Plant.db"
+    persist_sqlite(_index(["Basil", "Mint", "Basil"], water=[1.0, "weekly", 3.0]), db_path, mode=mode)
+    assert _rows(db_path) == [("Basil", 3, "Loam"), ("Mint", None, None)]
+    con = sqlite3.connect(db_path)
+    assert con.execute("SELECT count(*) FROM plants_fts WHERE plants_fts MATCH 'mint'").fetchone() == (1,)
+    con.close()
+
+
+def test_bulk_load_replaces_table_and_rebuilds_fts(tmp_path):
+    db_path = tmp_path / "Plant.db"
+    persist_sqlite(_index(["Basil", "Old Rose"]), db_path)
+    persist_sqlite(_index(["Basil", "Sweet Basil", "Mint"]), db_path, mode="bulk")
+    assert [r[0] for r in _rows(db_path)] == ["Basil", "Mint", "Sweet Basil"]
+
+    con = sqlite3.connect(db_path)
+    hits = con.execute("SELECT rowid FROM plants_fts WHERE plants_fts MATCH 'basil*'").fetchall()
+    assert len(hits) == 2
+    # triggers are back on the swapped-in table
+    con.execute("INSERT INTO plants(name) VALUES ('Rosemary')")
+    assert con.execute("SELECT count(*) FROM plants_fts WHERE plants_fts MATCH 'rose*'").fetchone() == (1,)
+    con.close()
+
+
+def test_delta_sync_writes_only_changes(tmp_path, caplog):
+    db_path = tmp_path / "Plant.db"
+    persist_sqlite(_index(["Basil", "Mint", "Old Rose"], water=[1.0, 2.0, 3.0]), db_path)
+    con = sqlite3.connect(db_path)
+    con.execute("CREATE TABLE writes(name TEXT)")
+    con.execute("CREATE TRIGGER log_update AFTER UPDATE ON plants BEGIN INSERT INTO writes VALUES (new.name); END")
+    con.commit()
+    con.close()
+
+    caplog.set_level("INFO", logger="src.data.plant_index")
+    index = _index(["Basil", "Mint", "Thyme"], water=[1.0, 5.0, 2.0])
+    index["sunlight_hours"] = [1.0, 4.5, 8.0]  # Basil/Mint keep their original sunlight
+    persist_sqlite(index, db_path, mode="delta")
+
+    assert "1 inserted, 1 updated, 1 deleted, 1 unchanged" in caplog.text
+    assert _rows(db_path) == [("Basil", 1, "Loam"), ("Mint", 5, None), ("Thyme", 2, "Loam")]
+    con = sqlite3.connect(db_path)
+    assert con.execute("SELECT name FROM writes").fetchall() == [("Mint",)]
+    assert con.execute("SELECT count(*) FROM plants_fts WHERE plants_fts MATCH 'rose'").fetchone() == (0,)
+    assert con.execute("SELECT count(*) FROM plants_fts WHERE plants_fts MATCH 'thyme'").fetchone() == (1,)
+    con.execute("INSERT INTO plants_fts(plants_fts) VALUES('integrity-check')")
+    con.close()
+
+
+def test_delta_sync_migrates_tables_without_hashes(tmp_path):
+    db_path = tmp_path / "Plant.db"
+    con = sqlite3.connect(db_path)
+    con.execute("CREATE TABLE plants (name TEXT PRIMARY KEY, water_frequency INTEGER, "
+                "sunlight_hours REAL, soil_type TEXT)")
+    con.execute("INSERT INTO plants VALUES ('Basil', 1, 1.0, 'Loam')")
+    con.commit()
+    con.close()
+
+    persist_sqlite(_index(["Basil"], water=[1.0]), db_path, mode="delta")
+    persist_sqlite(_index(["Basil"], water=[1.0]), db_path, mode="delta")
+    assert _rows(db_path) == [("Basil", 1, "Loam")]
+
+
+def test_bulk_load_builds_one_unique_name_index(tmp_path):
+    db_path = tmp_path / "Plant.db"
+    persist_sqlite(_index(["Basil", "Mint", "Basil"], water=[1.0, 2.0, 3.0]), db_path, mode="bulk")
+    con = sqlite3.connect(db_path)
+    indexes = con.execute("SELECT name, \"unique\" FROM pragma_index_list('plants')").fetchall()
+    con.close()
+    assert indexes == [("idx_plants_name", 1)]
+    assert _rows(db_path) == [("Basil", 3, "Loam"), ("Mint", 2, None)]
+
+    # The unique index is the conflict target for later upsert/delta runs
+    persist_sqlite(_index(["Mint"], water=[5.0]), db_path, mode="upsert")
+    persist_sqlite(_index(["Mint", "Sage"], water=[5.0, 1.0]), db_path, mode="delta")
+    assert _rows(db_path) == [("Mint", 5, "Loam"), ("Sage", 1, None)]
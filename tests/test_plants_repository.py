@@ -0,0 +1,213 @@
+import sqlite3
+
+import pytest
+
+from src.components.Backend.Repositories.db import PlantsRepository, fts_match_expression
+
+
+@pytest.fixture()
+def fts_db(plants_db):
+    con = sqlite3.connect(plants_db)
+    con.executescript("""
+        INSERT INTO plants(name, water_frequency, sunlight_hours, soil_type) VALUES
+          ('Tomato', 3, 8.0, 'Loam'),
+          ('Cherry Tomato', 3, 8.0, 'Loam'),
+          ('Rosemary', 7, 6.0, 'Sandy');
+        CREATE VIRTUAL TABLE plants_fts USING fts5(name, content='plants', content_rowid='rowid');
+        INSERT INTO plants_fts(plants_fts) VALUES('rebuild');
+    """)
+    con.close()
+    return plants_db
+
+
+def test_fts_match_expression_quotes_tokens():
+    assert fts_match_expression("rose mar") == '"rose"* "mar"*'
+    assert fts_match_expression('to" OR *') == '"to"* "OR"*'
+    assert fts_match_expression("  -- ") is None
+
+
+def test_search_uses_fts_prefix_match(app, fts_db):
+    with app.app_context():
+        rows = PlantsRepository().search("tom")
+    assert [r["name"] for r in rows] == ["Tomato", "Cherry Tomato"]
+
+
+def test_search_falls_back_to_like_without_fts(app, plants_db):
+    with app.app_context():
+        rows = PlantsRepository().search("thos")
+    assert [r["name"] for r in rows] == ["Pothos"]
+
+
+def test_search_cache_hits_until_db_changes(app, plants_db):
+    con = sqlite3.connect(plants_db)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.close()
+    repo = PlantsRepository()
+    with app.app_context():
+        first = repo.search("Poth")
+        assert repo.search("  POTH ") is first
+        con = sqlite3.connect(plants_db)
+        con.execute("INSERT INTO plants(name) VALUES ('Pothos Neon')")
+        con.commit()
+        con.close()
+        assert [r["name"] for r in repo.search("poth")] == ["Pothos", "Pothos Neon"]
+
+
+def test_search_cache_evicts_and_expires():
+    from src.components.Backend.Repositories.cache import SearchCache
+
+    now = [0.0]
+    cache = SearchCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    for key in ("a", "b", "c"):
+        cache.put(key, (1,), [{"name": key}])
+    assert len(cache) == 2
+    assert cache.get("a", (1,)) is None
+    now[0] = 11
+    assert cache.get("b", (1,)) is None
+
+
+def test_trigram_index_ranks_misspellings():
+    from src.components.Backend.Repositories.trigram import TrigramIndex
+
+    index = TrigramIndex([(1, "Pothos"), (2, "Rosemary"), (3, "Potato"), (4, "Basil")])
+    assert index.search("pothas")[0][0] == 1
+    assert index.search("rosemery")[0][0] == 2
+    assert index.search("xyz") == []
+
+
+@pytest.mark.parametrize("threshold", [0.1, 0.3, 0.6])
+def test_trigram_search_matches_brute_force_similarity(threshold):
+    import random
+    from src.components.Backend.Repositories.trigram import TrigramIndex, trigrams
+
+    rng = random.Random(0)
+    words = ["".join(rng.choice("abcdefghlmnoprst") for _ in range(rng.randint(3, 8))) for _ in range(60)]
+    # "plant" is in most names, so its trigrams are the common ones a query skips
+    names = [(i, f"{rng.choice(words)} {rng.choice(words)} plant" if i % 4 else rng.choice(words))
+             for i in range(1, 3001)]
+    names += [(5000, ""), (5001, None), (5002, "Plant plant")]
+    index = TrigramIndex(names)
+
+    for query in [names[17][1], names[18][1][:-2] + "xx", "plant", "green plant", words[3]]:
+        q = trigrams(query)
+        expected = []
+        for rowid, name in names:
+            t = trigrams(name or "")
+            if q & t and len(q & t) / len(q | t) >= threshold:
+                expected.append((rowid, len(q & t) / len(q | t)))
+        expected.sort(key=lambda r: (-r[1], r[0]))
+        got = index.search(query, limit=len(names), threshold=threshold)
+        assert [rowid for rowid, _ in got] == [rowid for rowid, _ in expected]
+        assert [score for _, score in got] == pytest.approx([score for _, score in expected])
+
+
+def test_trigram_search_with_probe_budget_keeps_exact_scores():
+    import random
+    from src.components.Backend.Repositories.trigram import TrigramIndex, trigrams
+
+    rng = random.Random(1)
+    words = ["".join(rng.choice("abcdefghlmnoprst") for _ in range(rng.randint(4, 8))) for _ in range(200)]
+    names = [(i, f"{rng.choice(words)} {rng.choice(words)} plant") for i in range(1, 5001)]
+    exact = TrigramIndex(names)
+    budgeted = TrigramIndex(names, probe_budget=512)
+
+    for _, name in names[:50]:
+        query = name[:3] + "x" + name[4:]
+        got = budgeted.search(query, limit=10)
+        assert got[0] == exact.search(query, limit=10)[0]
+        for hit, score in got:
+            q, t = trigrams(query), trigrams(names[hit - 1][1])
+            assert score == pytest.approx(len(q & t) / len(q | t))
+    # "plant" is in every name; the budget caps how many are looked at
+    assert len(budgeted.search("plant", limit=len(names))) <= 512 // 16 < len(exact.search("plant", limit=len(names)))
+
+
+def test_fuzzy_search_route(client, fts_db):
+    r = client.get("/api/plants/search?q=rosemery&fuzzy=1")
+    assert r.status_code == 200
+    assert r.get_json()[0]["name"] == "Rosemary"
+
+
+def test_connection_pool_reuses_readonly_connections(plants_db):
+    from src.components.Backend.Repositories.db import ConnectionPool
+
+    pool = ConnectionPool(plants_db, size=1)
+    con = pool.acquire()
+    with pytest.raises(sqlite3.OperationalError):
+        con.execute("INSERT INTO plants(name) VALUES ('x')")
+    pool.release(con)
+    assert pool.acquire() is con
+    extra = pool.acquire()
+    pool.release(con)
+    pool.release(extra)
+    assert pool.acquire() is con
+    pool.close()
+
+
+@pytest.mark.parametrize("with_fts", [True, False])
+def test_search_paginates_with_cursor(client, plants_db, with_fts):
+    con = sqlite3.connect(plants_db)
+    con.executemany("INSERT INTO plants(name) VALUES (?)", [(f"Basil {i:02d}",) for i in range(7)])
+    if with_fts:
+        con.executescript("""
+            CREATE VIRTUAL TABLE plants_fts USING fts5(name, content='plants', content_rowid='rowid');
+            INSERT INTO plants_fts(plants_fts) VALUES('rebuild');
+        """)
+    con.commit()
+    con.close()
+
+    seen, cursor = [], None
+    for _ in range(4):
+        url = "/api/plants/search?q=basil&limit=3" + (f"&cursor={cursor}" if cursor else "")
+        r = client.get(url)
+        assert r.status_code == 200
+        seen += [row["name"] for row in r.get_json()]
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == [f"Basil {i:02d}" for i in range(7)]
+
+
+def test_search_rejects_bad_cursor_and_limit(client):
+    assert client.get("/api/plants/search?q=poth&cursor=nope").status_code == 400
+    assert client.get("/api/plants/search?q=poth&limit=abc").status_code == 400
+
+
+def test_search_ignores_unpopulated_fts_index(client, plants_db):
+    con = sqlite3.connect(plants_db)
+    con.execute("CREATE VIRTUAL TABLE plants_fts USING fts5(name, content='plants', content_rowid='rowid')")
+    con.commit()
+    con.close()
+    r = client.get("/api/plants/search?q=Poth")
+    assert [row["name"] for row in r.get_json()] == ["Pothos"]
+
+
+def test_queries_are_timed_and_slow_ones_logged(client, fts_db, monkeypatch, caplog):
+    import src.components.Backend.Metrics.prometheus as prom
+    monkeypatch.setattr(prom, "SLOW_QUERY_MS", 0)
+    caplog.set_level("WARNING", logger="db.slow_query")
+
+    assert client.get("/api/plants/search?q=tom").status_code == 200
+    assert "slow query plants.search_fts" in caplog.text
+    scrape = client.get("/metrics").get_data(as_text=True)
+    assert 'db_query_duration_seconds_count{db="plants",query="search_fts"}' in scrape
+    assert 'db_query_rows_sum{db="plants",query="search_fts"}' in scrape
+
+
+def test_readonly_connection_escapes_uri_characters(tmp_path):
+    from src.components.Backend.Repositories.db import ConnectionPool
+
+    db_path = tmp_path / "odd #1 ?50%" / "Plant.db"
+    db_path.parent.mkdir()
+    con = sqlite3.connect(db_path)
+    con.execute("CREATE TABLE plants(name TEXT)")
+    con.execute("INSERT INTO plants VALUES ('Basil')")
+    con.commit()
+    con.close()
+
+    pool = ConnectionPool(db_path, size=1)
+    con = pool.acquire()
+    assert con.execute("SELECT name FROM plants").fetchall()[0]["name"] == "Basil"
+    pool.release(con)
+    pool.close()
+    assert sorted(p.name for p in db_path.parent.iterdir()) == ["Plant.db"]
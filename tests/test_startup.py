@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Runs in a fresh interpreter so modules already imported by other tests
+# (pandas via Cleaning, ...) do not hide a regression.
+STARTUP_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from src.components.Backend.App_factory import create_app
+t1 = time.perf_counter()
+app = create_app({"TESTING": True})
+client = app.test_client()
+status = client.get("/health").status_code
+t2 = time.perf_counter()
+client.post("/login", data={"email": "nobody@example.com", "password": "x"})
+print(json.dumps({
+    "import_seconds": t1 - t0,
+    "first_response_seconds": t2 - t0,
+    "status": status,
+    "heavy_modules": sorted(m for m in ("pandas", "numpy", "kagglehub") if m in sys.modules),
+}))
+"""
+
+
+def _probe(tmp_path):
+    env = {"PLANT_DB_PATH": str(tmp_path / "Plant.db"), "ACCOUNTS_DB_PATH": str(tmp_path / "Accounts.db"),
+           "DATA_DIR": str(tmp_path), "PATH": ""}
+    out = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_startup_skips_etl_dependencies(tmp_path):
+    result = _probe(tmp_path)
+    print(f"startup: import {result['import_seconds']:.3f}s, "
+          f"first response {result['first_response_seconds']:.3f}s")
+    assert result["status"] == 200
+    assert result["heavy_modules"] == []
+    # Generous bound: catches an ETL import creeping back in (pandas alone
+    # adds ~0.5s), not machine-to-machine noise
+    assert result["first_response_seconds"] < 3.0
+
+
+def test_importing_auth_has_no_side_effects(tmp_path, monkeypatch):
+    import importlib
+    import src.data.database as database
+    monkeypatch.setattr(database, "db_path", tmp_path / "Accounts.db")
+    import src.data.Auth as auth
+    importlib.reload(auth)
+    assert not (tmp_path / "Accounts.db").exists()